@@ -8,9 +8,17 @@ from contextvars import ContextVar
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 import aio_pika
-import json
 import re
 
+try:
+    # Быстрая сериализация JSON сразу в байты (UTF-8, без экранирования не-ASCII символов)
+    from orjson import dumps as json_dumps
+except ImportError:
+    import json
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode()
+
 from rich.console import Console
 from rich.text import Text
 
@@ -232,7 +240,7 @@ class RabbitLogger:
         # Если нужно передавать лог в очередь
         if self.config.rabbitmq.enabled:
             try:
-                body = json.dumps(message, ensure_ascii=False).encode()
+                body = json_dumps(message)
                 await self._channel.default_exchange.publish( # type: ignore
                     aio_pika.Message(body=body),
                     routing_key=self.config.queue # type: ignore
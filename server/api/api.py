@@ -1,20 +1,67 @@
+from contextlib import asynccontextmanager, suppress
+import asyncio
+import logging
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from aio_pika import connect_robust
 import uvicorn
 
-from server.config.config import ConfigManager as cfg
-from server.api.routes import config, logs, health
+from server.config.config import get_config_manager
+from server.api.routes import config, health
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """ Жизненный цикл приложения: одно подключение к RabbitMQ на всё время работы API
+
+    Arguments:
+        app {FastAPI} -- Экземпляр приложения
+    """
+
+    app.state.connection = None
+    app.state.channel = None
+    app.state.update_queue = None
+    app.state.publisher_task = None
+
+    # Конфигурация загружается при старте приложения, а не при импорте модуля
+    rabbitmq = get_config_manager().config.api.rabbitmq
+    try:
+        app.state.connection = await connect_robust(f"amqp://{rabbitmq.username}:{rabbitmq.password}@{rabbitmq.host}:{rabbitmq.port}/")
+        app.state.channel = await app.state.connection.channel()
+        await app.state.channel.declare_queue("service_queue", durable=True, arguments={"x-message-ttl": 30000})
+
+        # Сообщения об обновлении конфигурации отправляются пачками в фоне
+        app.state.update_queue = asyncio.Queue()
+        app.state.publisher_task = asyncio.create_task(config.publish_update_config(app.state.channel, app.state.update_queue))
+    except Exception as e:
+        logger.error("Ошибка подключения API к RabbitMQ %s:%s - %s", rabbitmq.host, rabbitmq.port, e)
+
+    try:
+        yield
+    finally:
+        if app.state.publisher_task:
+            app.state.publisher_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await app.state.publisher_task
+        if app.state.connection:
+            await app.state.connection.close()
 
 
 def fastapi():
     app = FastAPI(
         title="Logger API",
         description="API для управления логами и настройками",
-        version="0.1.0"
+        version="0.1.0",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan
     )
 
-    # Подключаем маршруты
+    # Подключаем маршруты (роутер логов пока отключён и не импортируется, чтобы не строить его модели при старте)
     # app.include_router(logs.router, prefix="/api/v1", tags=["logs"])
-    
+
     app.include_router(config.router, prefix="/api/v1", tags=["config"])
     app.include_router(health.router, prefix="/api/v1", tags=["health"])
 
@@ -22,4 +69,11 @@ def fastapi():
 
 
 if __name__ == "__main__":
-    uvicorn.run(fastapi(), host="0.0.0.0", port=8000)
\ No newline at end of file
+    uvicorn.run(
+        "server.api.api:fastapi",
+        factory=True,
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",        # uvloop (libuv), если установлен (на Windows его нет); иначе стандартный asyncio
+        http="auto"         # httptools (C-парсер HTTP), если установлен; иначе h11
+    )
\ No newline at end of file
@@ -1,78 +1,116 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from pydantic import ValidationError
-from aio_pika import connect_robust, Message
-import json
+from aio_pika import DeliveryMode, Message
+from aio_pika.abc import AbstractChannel
+import orjson
+import asyncio
+import logging
 
-from server.config.schema import ServerConfig
-from server.config.config import ConfigManager as cfg
+from server.config.schema import validate_server_json
+from server.config.config import Manager, get_config_manager
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
-async def send_update_config(new_config_data: dict) -> None:
-    """ Функция для отправки обновлённой конфигурации в очередь
+_BATCH_SIZE = 100       # Максимальное количество сообщений в одной пачке
+_BATCH_TIMEOUT = 0.05   # Максимальное время добора пачки (в секундах)
+_MSG_HEADERS = {        # Общие свойства всех сообщений об обновлении конфигурации
+    "content_type": "application/json",
+    "delivery_mode": DeliveryMode.PERSISTENT,
+    "type": "config_update"     # Тип сообщения: Consumer распознаёт сигнал без разбора JSON
+}
+
+async def send_update_config(queue: asyncio.Queue, new_config_data: bytes) -> None:
+    """ Функция для постановки обновлённой конфигурации в очередь отправки
 
     Arguments:
-        new_config_data {dict} -- Новая конфигурация
+        queue {asyncio.Queue} -- Очередь сообщений, которую разбирает publish_update_config
+        new_config_data {bytes} -- Новая конфигурация (провалидированный JSON, вставляется в сообщение без повторного разбора)
     """
     
-    async def generate_url() -> str | None:
-        """ Функция для генерации URL для подключения к RabbitMQ
+    message_body = {
+        "code": 100,
+        "detail": "Update config",
+        "data": orjson.Fragment(new_config_data)
+    }
+    queue.put_nowait(Message(body=orjson.dumps(message_body), **_MSG_HEADERS))
 
-        Returns:
-            str | None -- URL для подключения к RabbitMQ или None, если не все параметры конфигурации указаны
-        """
-        
-        config = cfg.config.api.rabbitmq
-        if config.host and config.port and config.username and config.password:
-            return f"amqp://{config.username}:{config.password}@{config.host}:{config.port}/"
-        else:
-            return None
+async def publish_update_config(channel: AbstractChannel, queue: asyncio.Queue) -> None:
+    """ Фоновая задача для отправки сообщений из очереди в RabbitMQ пачками
+
+    Набирает до _BATCH_SIZE сообщений (или ждёт не дольше _BATCH_TIMEOUT секунд)
+    и публикует их одновременно, ожидая подтверждения брокера сразу для всей пачки.
+
+    Arguments:
+        channel {AbstractChannel} -- Открытый канал RabbitMQ с publisher confirms
+        queue {asyncio.Queue} -- Очередь сообщений для отправки
+    """
     
-    connection = await connect_robust(await generate_url())
-    async with connection:
-        channel = await connection.channel()
-        queue = await channel.declare_queue("service_queue", durable=True, arguments={"x-message-ttl": 30000})
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + _BATCH_TIMEOUT
+        
+        # Добираем пачку, пока не истечёт время ожидания
+        while len(batch) < _BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
         
-        message_body = {
-            "code": 100,
-            "detail": "Update config",
-            "data": new_config_data
-        }
-        serialized_message = json.dumps(message_body)
-        message = Message(body=serialized_message.encode(), content_type='application/json')
-        await channel.default_exchange.publish(message, routing_key=queue.name)
+        results = await asyncio.gather(
+            *(channel.default_exchange.publish(message, routing_key="service_queue") for message in batch),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Ошибка отправки обновлённой конфигурации в RabbitMQ: %s", result)
 
-@router.get("/config", response_model=ServerConfig, description="Получение текущей конфигурации проекта")
-async def get_current_config():
+@router.get("/config", description="Получение текущей конфигурации проекта")
+async def get_current_config(cfg: Manager = Depends(get_config_manager)):
     """ Маршрут для получения текущей конфигурации проекта
 
+    Arguments:
+        cfg {Manager} -- Менеджер конфигураций
+
     Returns:
-        ServerConfig -- Актуальная конфигурация проекта
+        Response -- Актуальная конфигурация проекта (заранее сериализованный JSON)
     """
     
-    return cfg.config
+    return Response(content=cfg.serialized(), media_type="application/json")
 
-@router.put("/config", response_model=ServerConfig, description="Обновление конфигурации проекта")
-async def update_config(new_config: dict):
+@router.put("/config", description="Обновление конфигурации проекта")
+async def update_config(request: Request, cfg: Manager = Depends(get_config_manager)):
     """ Маршрут для обновления конфигурации проекта
 
     Arguments:
-        new_config {dict} -- Новая конфигурация проекта
+        request {Request} -- Запрос с новой конфигурацией проекта в теле (JSON)
+        cfg {Manager} -- Менеджер конфигураций
 
     Returns:
-        ServerConfig -- Новая конфигурация проекта
+        Response -- Новая конфигурация проекта
     """
     
+    # Без подключения к RabbitMQ Consumer не узнает о новой конфигурации: отказываем до её сохранения
+    update_queue = request.app.state.update_queue
+    if update_queue is None:
+        logger.error("Обновление конфигурации отклонено: нет подключения API к RabbitMQ")
+        raise HTTPException(status_code=503, detail="RabbitMQ is unavailable, config was not updated")
+    
     try:
-        validation_data = ServerConfig(**new_config)        # Проверяем валидность данных
-        await cfg.update_config(new_config_data=new_config) # Обновляем конфигурацию
-        await send_update_config(new_config)                # Отправляем обновлённую конфигурацию в очередь
-        return validation_data                              # Возвращаем обновлённую конфигурацию
+        raw_config = await request.body()                       # Получаем тело запроса без разбора JSON
+        validation_data = validate_server_json(raw_config)      # Разбираем и проверяем данные за один проход
+        await cfg.update_config(new_config_data=validation_data) # Обновляем конфигурацию
+        await send_update_config(update_queue, raw_config)      # Отправляем обновлённую конфигурацию в очередь
+        return Response(content=cfg.serialized(), media_type="application/json") # Возвращаем обновлённую конфигурацию (уже сериализована менеджером)
     
     except ValidationError as e:
-        print(f"Error validating new config: {e}")
-        return HTTPException(status_code=400, detail="Error validation new config")
+        logger.warning("Новая конфигурация не прошла валидацию: %s", e)
+        raise HTTPException(status_code=400, detail="Error validation new config")
     
     except Exception as e:
-        print(f"Error updating config: {e}")
-        return HTTPException(status_code=500, detail="Internal Server Error")
\ No newline at end of file
+        logger.exception("Ошибка обновления конфигурации: %s", e)
+        raise HTTPException(status_code=500, detail="Internal Server Error")
\ No newline at end of file
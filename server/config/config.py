@@ -2,14 +2,19 @@
 # Модуль для получения параметров окружения
 
 import asyncio
+import functools
+import logging
 import os
 import json
+import orjson
 from dotenv import load_dotenv
 from pathlib import Path
 from pydantic import ValidationError
-from typing import List, Callable, Dict, Any
+from typing import Callable, Dict, Any, Union
 
-from server.config.schema import ServerConfig
+from server.config.schema import ServerConfig, validate_server
+
+logger = logging.getLogger(__name__)
 
 GlobalEnvironment = "test"
 
@@ -24,12 +29,15 @@ class Manager:
         
         self._config_file_path = Path(__file__).parent / f"config.{GlobalEnvironment}.json"
         self._config: ServerConfig = initial_config
-        self._callbacks: List[Callable[[ServerConfig], None]] = []
+        self._cached_bytes: bytes = orjson.dumps(initial_config.model_dump(mode="json"))  # Сериализованная конфигурация для GET /config
+        self._callbacks: Dict[int, Callable[[ServerConfig], None]] = {}  # Подписчики по дескриптору (id функции)
         self._lock = asyncio.Lock()  # Для thread-safe обновлений (в asyncio контексте)
+        self._file_lock = asyncio.Lock()  # Для последовательной записи конфигурации в файл
+        self._last_bytes: bytes | None = None  # Содержимое файла конфигурации после последней записи
 
     @property
     def config(self) -> ServerConfig:
-        """ Функция для получения текущей конфигурации
+        """ Функция для получения текущей конфигурации (без блокировки: конфигурация заменяется целиком одним присваиванием)
 
         Returns:
             ServerConfig -- Актуальная конфигурация
@@ -37,30 +45,43 @@ class Manager:
         
         return self._config
 
-    def subscribe(self, callback: Callable[[ServerConfig], None]) -> None:
+    def serialized(self) -> bytes:
+        """ Функция для получения текущей конфигурации в виде готового JSON
+
+        Returns:
+            bytes -- JSON конфигурация (пересчитывается только при изменении конфигурации)
+        """
+        
+        return self._cached_bytes
+
+    def subscribe(self, callback: Callable[[ServerConfig], None]) -> int:
         """ Функция для подписки на события
 
         Arguments:
             callback {Callable[[ServerConfig], None]} -- Функция обработчик события
+
+        Returns:
+            int -- Дескриптор подписки для отписки
         """
         
-        self._callbacks.append(callback)
+        handle = id(callback)
+        self._callbacks[handle] = callback
+        return handle
 
-    def unsubscribe(self, callback: Callable[[ServerConfig], None]) -> None:
+    def unsubscribe(self, handle: int) -> None:
         """ Функция для отписки от событий
 
         Arguments:
-            callback {Callable[[ServerConfig], None]} -- Функция обработчик события
+            handle {int} -- Дескриптор подписки, полученный от subscribe
         """
         
-        if callback in self._callbacks:
-            self._callbacks.remove(callback)
+        self._callbacks.pop(handle, None)
 
-    async def update_config(self, new_config_data: dict) -> ServerConfig:
+    async def update_config(self, new_config_data: Union[dict, ServerConfig]) -> ServerConfig:
         """ Функция для обновления конфигурации по входным данным
 
         Arguments:
-            new_config_data {dict} -- Новая конфигурация
+            new_config_data {Union[dict, ServerConfig]} -- Новая конфигурация (словарь или уже провалидированная модель)
 
         Raises:
             ValueError: Ошибка валидации новой конфигурации
@@ -69,26 +90,38 @@ class Manager:
             ServerConfig -- Новая конфигурация
         """
         
+        try:
+            # Валидируем новые данные и создаём новую модель вне блокировки (уже провалидированную модель используем как есть)
+            if isinstance(new_config_data, ServerConfig):
+                validated_config = new_config_data
+            else:
+                validated_config = validate_server(new_config_data)
+        except ValidationError as e:
+            logger.warning("Ошибка валидации новой конфигурации: %s", e)
+            raise ValueError(f"Invalid configuration data: {e}")
+        config_dict = validated_config.model_dump(mode="json")
+        new_cached_bytes = orjson.dumps(config_dict)
+
+        # Под блокировкой только публикуем полностью готовый снимок (чтение config идёт без блокировки)
         async with self._lock:
-            try:
-                # Валидируем новые данные и создаём новую модель
-                validated_config = ServerConfig(**new_config_data)
-                old_config = self._config
-                self._config = validated_config
-
-                # Уведомляем всех подписчиков ТОЛЬКО если конфиг изменился
-                if old_config != self._config:
-                    for callback in self._callbacks:
-                        print('Send callback')
-                        callback(self._config)
-                        
-                # Сохраняем конфигурацию в файл
-                self._save_config_to_file(new_config_data)
-
-                return self._config
-            except ValidationError as e:
-                print(f"❌ Ошибка валидации новой конфигурации: {e}")
-                raise ValueError(f"Invalid configuration data: {e}")
+            changed = new_cached_bytes != self._cached_bytes  # Сравнение готового JSON вместо глубокого сравнения моделей
+            self._config = validated_config
+            self._cached_bytes = new_cached_bytes
+
+        # Уведомляем всех подписчиков ТОЛЬКО если конфиг изменился (вне блокировки)
+        if changed:
+            for callback in list(self._callbacks.values()):
+                callback(validated_config)
+
+        # Сохраняем конфигурацию в файл вне основной блокировки и вне event loop
+        async with self._file_lock:
+            if self._config is validated_config:  # Более новую конфигурацию сохранит её собственный вызов
+                new_bytes = orjson.dumps(config_dict, option=orjson.OPT_INDENT_2)
+                if new_bytes != self._last_bytes:  # Повторная отправка той же конфигурации не трогает диск
+                    if await asyncio.to_thread(self._save_config_to_file, new_bytes):
+                        self._last_bytes = new_bytes
+
+        return validated_config
 
     async def reload_from_source(self, source_loader_func) -> ServerConfig:
         """ Функция для перезагрузки конфигурации из источника
@@ -103,40 +136,47 @@ class Manager:
             ServerConfig -- JSON конфигурация
         """
         
+        try:
+            # Загружаем, валидируем и сериализуем новую конфигурацию вне блокировки
+            raw_data = source_loader_func()
+            validated_config = validate_server(raw_data)
+        except ValidationError as e:
+            logger.warning("Ошибка валидации перезагруженной конфигурации: %s", e)
+            raise ValueError(f"Invalid configuration data from source: {e}")
+        new_cached_bytes = orjson.dumps(validated_config.model_dump(mode="json"))
+
+        # Под блокировкой только публикуем полностью готовый снимок
         async with self._lock:
-            try:
-                raw_data = source_loader_func()
-                validated_config = ServerConfig(**raw_data)
-                old_config = self._config
-                self._config = validated_config
+            changed = new_cached_bytes != self._cached_bytes  # Сравнение готового JSON вместо глубокого сравнения моделей
+            self._config = validated_config
+            self._cached_bytes = new_cached_bytes
 
-                # Уведомляем подписчиков только если конфиг действительно изменился
-                if old_config != self._config:
-                    for callback in self._callbacks:
-                        callback(self._config)
+        # Уведомляем подписчиков только если конфиг действительно изменился (вне блокировки)
+        if changed:
+            for callback in list(self._callbacks.values()):
+                callback(validated_config)
 
-                return self._config
-            except ValidationError as e:
-                print(f"❌ Ошибка валидации перезагруженной конфигурации: {e}")
-                raise ValueError(f"Invalid configuration data from source: {e}")
+        return validated_config
 
-    def _save_config_to_file(self, config_dict: Dict[str, Any]) -> bool:
-        """ Функция для сохранения конфигурации в файл
+    def _save_config_to_file(self, config_bytes: bytes) -> bool:
+        """ Функция для атомарного сохранения конфигурации в файл (через временный файл и os.replace)
 
         Arguments:
-            config_dict {Dict[str, Any]} -- JSON конфигурация
+            config_bytes {bytes} -- JSON конфигурация
 
         Returns:
             bool -- Статус сохранения
         """
         
         try:
-            with open(self._config_file_path, 'w', encoding='utf-8') as f:
-                json.dump(config_dict, f, indent=2, ensure_ascii=False)
+            tmp_path = self._config_file_path.with_suffix(".json.tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(config_bytes)
+            os.replace(tmp_path, self._config_file_path)
                 
             return True
         except Exception as e:
-            print(f"Error save config to json file: {e}")
+            logger.exception("Error save config to json file: %s", e)
             return False
         
     async def refresh(self) -> bool:
@@ -150,16 +190,17 @@ class Manager:
             if self._config_file_path.exists():
                 with open(self._config_file_path, 'r', encoding='utf-8') as f:
                     raw_config = json.load(f)
-                self._config = ServerConfig(**raw_config)
+                self._config = validate_server(raw_config)
+                self._cached_bytes = orjson.dumps(self._config.model_dump(mode="json"))
             
                 return True
             else:
                 return False  
         except ValidationError as e:
-            print(f"Error in refresh config - ValidationError: {e}")
+            logger.warning("Error in refresh config - ValidationError: %s", e)
             return False
         except Exception as e:
-            print(f"Error in refresh config: {e}")
+            logger.exception("Error in refresh config: %s", e)
             return False
 
 
@@ -191,14 +232,8 @@ class Config:
             dict -- Словарь с конфигурациями для подключения к RabbitMQ
         """
         
-        return {
-            "host": os.getenv("RABBITMQ_HOST", "localhost"),
-            "port": int(os.getenv("RABBITMQ_PORT", 5672)),
-            "username": os.getenv("RABBITMQ_USERNAME", "logger"),
-            "password": os.getenv("RABBITMQ_PASSWORD", "logger"),
-            "queue": os.getenv("RABBITMQ_QUEUE", "logger")
-        }
-        
+        return self._snapshot["rabbitmq"]
+
     @property
     def timescaledb(self) -> dict:
         """ Функция для получения словаря с конфигурациями для подключения к TimescaleDB
@@ -207,15 +242,8 @@ class Config:
             dict -- Словарь с конфигурациями для подключения к TimescaleDB
         """
         
-        return {
-            "enabled": os.getenv("TIMESCALEDB_ENABLED", False),
-            "host": os.getenv("TIMESCALEDB_HOST", "localhost"),
-            "port": int(os.getenv("TIMESCALEDB_PORT", 5432)),
-            "username": os.getenv("TIMESCALEDB_USERNAME", "logger"),
-            "password": os.getenv("TIMESCALEDB_PASSWORD", "logger"),
-            "database": os.getenv("TIMESCALEDB_DATABASE", "logger")
-        }
-        
+        return self._snapshot["timescaledb"]
+
     @property
     def logger(self) -> dict:
         """ Функция для получения словаря с конфигурациями логирования
@@ -224,10 +252,8 @@ class Config:
             dict -- Словарь с конфигурациями логирования для библиотеки
         """
         
-        return {
-            "project_name": os.getenv("PROJECT_NAME", "DefaultProject"),
-        }
-        
+        return self._snapshot["logger"]
+
     @property
     def console(self) -> dict:
         """ Функция для получения словаря с конфигурациями консольного логирования
@@ -236,28 +262,8 @@ class Config:
             dict -- Словарь с конфигурациями консольного логирования
         """
         
-        return {
-            "enabled": os.getenv("CONSOLE_ENABLED", True),
-            "format": os.getenv("CONSOLE_FORMAT", "[{project}] [{timestamp}] [{level}] {module}.{function}: {message} [{code}]"),
-            "project_style": os.getenv("CONSOLE_PROJECT_STYLE", "bold cyan"),
-            "timestamp_style": os.getenv("CONSOLE_TIMESTAMP_STYLE", "dim cyan"),
-            "level_styles": {
-                "info": os.getenv("CONSOLE_LEVEL_INFO_STYLE", "bold magenta"),
-                "warning": os.getenv("CONSOLE_LEVEL_WARNING_STYLE", "bold yellow"),
-                "error": os.getenv("CONSOLE_LEVEL_ERROR_STYLE", "bold red"),
-                "fatal": os.getenv("CONSOLE_LEVEL_FATAL_STYLE", "bold white on red"),
-                "debug": os.getenv("CONSOLE_LEVEL_DEBUG_STYLE", "dim cyan"),
-                "alert": os.getenv("CONSOLE_LEVEL_ALERT_STYLE", "bold magenta"),
-                "unknown": os.getenv("CONSOLE_LEVEL_UNKNOWN_STYLE", "")
-            },
-            "module_style": os.getenv("CONSOLE_MODULE_STYLE", "green"),
-            "function_style": os.getenv("CONSOLE_FUNCTION_STYLE", "magenta"),
-            "message_style": os.getenv("CONSOLE_MESSAGE_STYLE", ""),
-            "code_style": os.getenv("CONSOLE_CODE_STYLE", "dim"),
-            "time_format": os.getenv("CONSOLE_TIME_FORMAT", "%Y-%m-%d %H:%M:%S"),
-            "time_zone": os.getenv("CONSOLE_TIME_ZONE", "UTC")
-        }
-    
+        return self._snapshot["console"]
+
     @property
     def files(self) -> dict:
         """ Функция для получения словаря с конфигурациями файлового логирования
@@ -266,56 +272,129 @@ class Config:
             dict -- Словарь с конфигурациями файлового логирования
         """
         
-        return {
-            "enabled": os.getenv("FILES_ENABLED", True),
-            "shared_directory": os.getenv("FILES_SHARED_DIRECTORY", "logs"),
-            "project_directory": os.getenv("FILES_PROJECT_DIRECTORY", "{project}"),
-            "filename": os.getenv("FILES_FILENAME", "log_{project}_{date}.log"),
-            "date_file_format": os.getenv("FILES_DATE_FILE_FORMAT", "%Y-%m-%d_%H-%M-%S"),
-            "date_log_format": os.getenv("FILES_DATE_LOG_FORMAT", "%Y-%m-%d %H:%M:%S"),
-            "date_timezone": os.getenv("FILES_DATE_TIMEZONE", "UTC"),
-            "log_format": os.getenv("FILES_LOG_FORMAT", "[{timestamp}] [{level}] {module}.{function}: {message} [{code}]"),
-            "rotation": {
-                "trigger": os.getenv("FILES_ROTATION_TRIGGER", "daily"),
-                "time": int(os.getenv("FILES_ROTATION_TIME", 24400)),
-                "daily": os.getenv("FILES_ROTATION_DAILY", "00:00"),
-                "size": int(os.getenv("FILES_ROTATION_SIZE", 10485760)),
-                "lines": int(os.getenv("FILES_ROTATION_LINES", 10000))
-            },
-            "archive": {
-                "enabled": os.getenv("FILES_ARCHIVE_ENABLED", False),
-                "type": os.getenv("FILES_ARCHIVE_TYPE", "zip"),
-                "compression_level": int(os.getenv("FILES_ARCHIVE_COMPRESSION_LEVEL", 6)),
-                "directory": os.getenv("FILES_ARCHIVE_DIRECTORY", "archive"),
-                "trigger": os.getenv("FILES_ARCHIVE_TRIGGER", "count"),
-                "count": int(os.getenv("FILES_ARCHIVE_COUNT", 10)),
-                "age": int(os.getenv("FILES_ARCHIVE_AGE", 244000))
-            }
-        }
-    
+        return self._snapshot["files"]
+
     @property
     def api(self) -> dict:
+        return self._snapshot["api"]
+    
+    @functools.cached_property
+    def _snapshot(self) -> Dict[str, dict]:
+        """ Функция для получения словарей с конфигурациями из переменных окружения
+
+        Снимок собирается один раз при первом обращении - только когда конфигурация берётся из окружения,
+        поэтому некорректная и не используемая переменная не мешает загрузке из файла.
+
+        Returns:
+            Dict[str, dict] -- Словари с конфигурациями по разделам
+        """
+        
+        return self._build_snapshot(os.environ.copy())
+    
+    @staticmethod
+    def _build_snapshot(env: Dict[str, str]) -> Dict[str, dict]:
+        """ Функция для сборки всех словарей с конфигурациями из снимка переменных окружения
+
+        Arguments:
+            env {Dict[str, str]} -- Снимок переменных окружения
+
+        Returns:
+            Dict[str, dict] -- Словари с конфигурациями по разделам
+        """
+        
         return {
-            "enabled": os.getenv("API_ENABLED", False),
-            "host": os.getenv("API_HOST", "localhost"),
-            "port": int(os.getenv("API_PORT", 8080)),
             "rabbitmq": {
-                "host": os.getenv("RABBITMQ_HOST", "localhost"),
-                "port": int(os.getenv("RABBITMQ_PORT", 5672)),
-                "username": os.getenv("RABBITMQ_USERNAME", "logger"),
-                "password": os.getenv("RABBITMQ_PASSWORD", "logger"),
+                "host": env.get("RABBITMQ_HOST", "localhost"),
+                "port": int(env.get("RABBITMQ_PORT", 5672)),
+                "username": env.get("RABBITMQ_USERNAME", "logger"),
+                "password": env.get("RABBITMQ_PASSWORD", "logger"),
+                "queue": env.get("RABBITMQ_QUEUE", "logger"),
+                "prefetch_count": int(env.get("RABBITMQ_PREFETCH_COUNT", 100)),
+                "consumers": int(env.get("RABBITMQ_CONSUMERS", 1)),
+                "heartbeat": int(env.get("RABBITMQ_HEARTBEAT", 60)),
+                "connect_timeout": float(env.get("RABBITMQ_CONNECT_TIMEOUT", 10))
+            },
+            "timescaledb": {
+                "enabled": env.get("TIMESCALEDB_ENABLED", False),
+                "host": env.get("TIMESCALEDB_HOST", "localhost"),
+                "port": int(env.get("TIMESCALEDB_PORT", 5432)),
+                "username": env.get("TIMESCALEDB_USERNAME", "logger"),
+                "password": env.get("TIMESCALEDB_PASSWORD", "logger"),
+                "database": env.get("TIMESCALEDB_DATABASE", "logger")
+            },
+            "logger": {
+                "project_name": env.get("PROJECT_NAME", "DefaultProject"),
+            },
+            "console": {
+                "enabled": env.get("CONSOLE_ENABLED", True),
+                "format": env.get("CONSOLE_FORMAT", "[{project}] [{timestamp}] [{level}] {module}.{function}: {message} [{code}]"),
+                "project_style": env.get("CONSOLE_PROJECT_STYLE", "bold cyan"),
+                "timestamp_style": env.get("CONSOLE_TIMESTAMP_STYLE", "dim cyan"),
+                "level_styles": {
+                    "info": env.get("CONSOLE_LEVEL_INFO_STYLE", "bold magenta"),
+                    "warning": env.get("CONSOLE_LEVEL_WARNING_STYLE", "bold yellow"),
+                    "error": env.get("CONSOLE_LEVEL_ERROR_STYLE", "bold red"),
+                    "fatal": env.get("CONSOLE_LEVEL_FATAL_STYLE", "bold white on red"),
+                    "debug": env.get("CONSOLE_LEVEL_DEBUG_STYLE", "dim cyan"),
+                    "alert": env.get("CONSOLE_LEVEL_ALERT_STYLE", "bold magenta"),
+                    "unknown": env.get("CONSOLE_LEVEL_UNKNOWN_STYLE", "")
+                },
+                "module_style": env.get("CONSOLE_MODULE_STYLE", "green"),
+                "function_style": env.get("CONSOLE_FUNCTION_STYLE", "magenta"),
+                "message_style": env.get("CONSOLE_MESSAGE_STYLE", ""),
+                "code_style": env.get("CONSOLE_CODE_STYLE", "dim"),
+                "time_format": env.get("CONSOLE_TIME_FORMAT", "%Y-%m-%d %H:%M:%S"),
+                "time_zone": env.get("CONSOLE_TIME_ZONE", "UTC")
             },
-            "routers": {
-                "logs": os.getenv("API_ROUTERS_LOGS", False),
-                "config": os.getenv("API_ROUTERS_CONFIG", False),
-                "health": os.getenv("API_ROUTERS_HEALTH", False)
+            "files": {
+                "enabled": env.get("FILES_ENABLED", True),
+                "shared_directory": env.get("FILES_SHARED_DIRECTORY", "logs"),
+                "project_directory": env.get("FILES_PROJECT_DIRECTORY", "{project}"),
+                "filename": env.get("FILES_FILENAME", "log_{project}_{date}.log"),
+                "date_file_format": env.get("FILES_DATE_FILE_FORMAT", "%Y-%m-%d_%H-%M-%S"),
+                "date_log_format": env.get("FILES_DATE_LOG_FORMAT", "%Y-%m-%d %H:%M:%S"),
+                "date_timezone": env.get("FILES_DATE_TIMEZONE", "UTC"),
+                "log_format": env.get("FILES_LOG_FORMAT", "[{timestamp}] [{level}] {module}.{function}: {message} [{code}]"),
+                "rotation": {
+                    "trigger": env.get("FILES_ROTATION_TRIGGER", "daily"),
+                    "time": int(env.get("FILES_ROTATION_TIME", 24400)),
+                    "daily": env.get("FILES_ROTATION_DAILY", "00:00"),
+                    "size": int(env.get("FILES_ROTATION_SIZE", 10485760)),
+                    "lines": int(env.get("FILES_ROTATION_LINES", 10000))
+                },
+                "archive": {
+                    "enabled": env.get("FILES_ARCHIVE_ENABLED", False),
+                    "type": env.get("FILES_ARCHIVE_TYPE", "zip"),
+                    "compression_level": int(env.get("FILES_ARCHIVE_COMPRESSION_LEVEL", 6)),
+                    "directory": env.get("FILES_ARCHIVE_DIRECTORY", "archive"),
+                    "trigger": env.get("FILES_ARCHIVE_TRIGGER", "count"),
+                    "count": int(env.get("FILES_ARCHIVE_COUNT", 10)),
+                    "age": int(env.get("FILES_ARCHIVE_AGE", 244000))
+                }
             },
-            "auth": {
-                "enabled": os.getenv("API_AUTH_ENABLED", False),
-                "secret": os.getenv("API_AUTH_SECRET", "secret")
+            "api": {
+                "enabled": env.get("API_ENABLED", False),
+                "host": env.get("API_HOST", "localhost"),
+                "port": int(env.get("API_PORT", 8080)),
+                "reload": env.get("API_RELOAD", False),
+                "rabbitmq": {
+                    "host": env.get("RABBITMQ_HOST", "localhost"),
+                    "port": int(env.get("RABBITMQ_PORT", 5672)),
+                    "username": env.get("RABBITMQ_USERNAME", "logger"),
+                    "password": env.get("RABBITMQ_PASSWORD", "logger"),
+                },
+                "routers": {
+                    "logs": env.get("API_ROUTERS_LOGS", False),
+                    "config": env.get("API_ROUTERS_CONFIG", False),
+                    "health": env.get("API_ROUTERS_HEALTH", False)
+                },
+                "auth": {
+                    "enabled": env.get("API_AUTH_ENABLED", False),
+                    "secret": env.get("API_AUTH_SECRET", "secret")
+                }
             }
         }
-    
+
     def _load_config(self) -> Dict[str, Any]:
         """ Функция для загрузки конфигурации из файла или переменного окружения
 
@@ -330,7 +409,7 @@ class Config:
             try:
                 with open(self._config_file_path, 'r', encoding='utf-8') as f:
                     raw_config = json.load(f)
-                ServerConfig(**raw_config)
+                validate_server(raw_config)
                 return raw_config
             except Exception as e:
                 return self._get_all_config()
@@ -338,11 +417,11 @@ class Config:
         else:
             env_config = self.get_all_env_config()
             try:
-                validated_env_config = ServerConfig(**env_config)
+                validated_env_config = validate_server(env_config)
                 self._save_config_to_file(validated_env_config.model_dump())
                 return validated_env_config.model_dump()
             except Exception as e:
-                print(f"❌ Ошибка валидации конфигурации из .env: {e}")
+                logger.error("Ошибка валидации конфигурации из .env: %s", e)
                 raise e
     
     def _save_config_to_file(self, config_dict: Dict[str, Any]) -> bool:
@@ -361,7 +440,7 @@ class Config:
                 
             return True
         except Exception as e:
-            print(f"Error save config to json file: {e}")
+            logger.exception("Error save config to json file: %s", e)
             return False
     
     def _get_all_config(self) -> Dict:
@@ -376,14 +455,32 @@ class Config:
         
         return raw_config
 
+    def get_all_config(self) -> Dict:
+        """ Функция для получения конфигурации, загруженной при создании объекта (без повторного чтения файла)
+
+        Returns:
+            Dict -- Словарь с параметрами
+        """
+        
+        return self._config_dict
+
     def get_all_env_config(self) -> Dict:
-        return {
-            "rabbitmq": self.rabbitmq,
-            "timescaledb": self.timescaledb,
-            "logger": self.logger,
-            "console": self.console,
-            "files": self.files,
-            "api": self.api
-        }
+        # Разделы собираются в снимок при первом обращении
+        return self._snapshot
+
+@functools.cache
+def get_config_manager() -> Manager:
+    """ Функция для получения менеджера конфигураций (создаётся при первом обращении, а не при импорте модуля)
+
+    Returns:
+        Manager -- Менеджер конфигураций
+    """
+    
+    return Manager(validate_server(Config(GlobalEnvironment).get_all_config()))
+
 
-ConfigManager = Manager(ServerConfig(**Config(GlobalEnvironment)._get_all_config())) # Менеджер конфигураций
+def __getattr__(name: str) -> Any:
+    # Ленивый доступ к ConfigManager для модулей, импортирующих его напрямую
+    if name == "ConfigManager":
+        return get_config_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
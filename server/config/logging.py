@@ -3,7 +3,7 @@
 
 import logging
 import sys
-from datetime import datetime
+import time
 
 # --- Кастомный Formatter, имитирующий стиль uvicorn с именем логгера ---
 class UvicornStyleFormatter(logging.Formatter):
@@ -11,19 +11,23 @@ class UvicornStyleFormatter(logging.Formatter):
     Кастомный форматтер, имитирующий стиль логов uvicorn,
     но добавляющий имя логгера.
     """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Кэш строки времени: записи в пределах одной секунды используют одну и ту же строку
+        self._last_sec = None
+        self._last_time_str = ""
+        # Заранее подготовленный шаблон строки: [HH:MM:SS] LEVEL: NAME - MESSAGE
+        self._fmt_template = "[%s] %s:     %s - %s"
+
     def format(self, record):
-        # Получаем время в формате HH:MM:SS
-        time_str = datetime.fromtimestamp(record.created).strftime('%H:%M:%S')
-        # Получаем уровень лога (INFO, ERROR и т.д.)
-        level_str = record.levelname
-        # Получаем имя логгера (например, server.consumer.consumer)
-        name_str = record.name
-        # Получаем сообщение
-        msg_str = record.getMessage()
-
-        # Формируем строку в стиле uvicorn + имя логгера
-        # [HH:MM:SS] LEVEL: NAME - MESSAGE
-        formatted_message = f"[{time_str}] {level_str}:     {name_str} - {msg_str}"
+        # Получаем время в формате HH:MM:SS (strftime вызывается не чаще раза в секунду)
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_time_str = time.strftime('%H:%M:%S', time.localtime(sec))
+            self._last_sec = sec
+
+        # Формируем строку в стиле uvicorn + имя логгера по готовому шаблону
+        formatted_message = self._fmt_template % (self._last_time_str, record.levelname, record.name, record.getMessage())
 
         # Если есть traceback, добавляем его
         if record.exc_info:
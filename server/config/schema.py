@@ -1,193 +1,378 @@
 # app/server/models/config_models.py
 # Класс для валидации настроек сервера
 
-from pydantic import BaseModel, Field, IPvAnyAddress
-from typing import Optional, Union, Literal
+import functools
+import ipaddress
+import string
 
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter
+from typing import Annotated, ClassVar, Optional, Literal, Tuple, Union
 
 
-class ServerConfig(BaseModel):
-    """ Класс для валидации настроек сервера
+@functools.lru_cache(maxsize=128)
+def _parse_ip(value: str) -> Union[ipaddress.IPv4Address, ipaddress.IPv6Address]:
+    """ Функция для разбора IP адреса (результат кэшируется: одни и те же адреса проверяются при каждой перезагрузке)
+
+    Arguments:
+        value {str} -- Ip адрес
+
+    Raises:
+        ValueError: Некорректный IP адрес
+
+    Returns:
+        Union[ipaddress.IPv4Address, ipaddress.IPv6Address] -- Разобранный IP адрес
+    """
+    
+    return ipaddress.ip_address(value)
+
+
+def _check_host(value: str) -> str:
+    """ Функция для проверки адреса хоста (IP адрес разбирается только если это не localhost)
+
+    Arguments:
+        value {str} -- Ip адрес или localhost
+
+    Raises:
+        ValueError: Некорректный IP адрес
+
+    Returns:
+        str -- Исходное значение
+    """
+    
+    if value != "localhost":
+        _parse_ip(value)
+    return value
+
+
+# Ip адрес или localhost: строка без объединения типов и разбор адреса одним вызовом
+_Host = Annotated[str, AfterValidator(_check_host)]
+
+
+@functools.lru_cache(maxsize=None)
+def _template_parts(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """ Функция для разбора шаблона лог-записи на текст и имена полей (один раз на шаблон)
+
+    Arguments:
+        template {str} -- Шаблон вида "[{project}] {message}"
+
+    Returns:
+        Tuple[Tuple[str, Optional[str]], ...] -- Пары (текст, имя поля или None)
+    """
+    
+    return tuple((literal, field) for literal, field, _, _ in string.Formatter().parse(template))
+
+
+# Вложенные модели вынесены на уровень модуля: схема каждой строится один раз и переиспользуется,
+# а неизменяемость (frozen) отключает валидацию при присваивании атрибутов
+
+class _TimescaleDB(BaseModel):
+    """ Класс для валидации настроек подключения в TimescaleDB
 
     Arguments:
         BaseModel {_type_} -- Базовый класс для валидации данных
     """
     
-    class TimescaleDB(BaseModel):        
-        """ Класс для валидации настроек подключения в TimescaleDB
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
+    enabled: bool = Field(default=True, description="Статус активации логирования в TimescaleDB")
+    
+    host: _Host = Field(default="localhost", description="Ip адрес или имя хоста для подключения к TimescaleDB")
+    port: int = Field(ge=1, le=65535, default=5432, description="Порт для подключения к TimescaleDB")
+    username: str = Field(default="logger", description="Имя пользователя для подключения к TimescaleDB")
+    password: str = Field(default="logger", description="Пароль для подключения к TimescaleDB")
+    database: str = Field(default="logger", description="База данных для подключения к TimescaleDB")
 
-        Arguments:
-            BaseModel {_type_} -- Базовый класс для валидации данных
-        """
-        
-        enabled: bool = Field(default=True, description="Статус активации логирования в TimescaleDB")
-        
-        host: Union[IPvAnyAddress, Literal["localhost"]] = Field(default="localhost", description="Ip адрес или имя хоста для подключения к TimescaleDB")
-        port: int = Field(ge=1, le=65535, default=5432, description="Порт для подключения к TimescaleDB")
-        username: str = Field(default="logger", description="Имя пользователя для подключения к TimescaleDB")
-        password: str = Field(default="logger", description="Пароль для подключения к TimescaleDB")
-        database: str = Field(default="logger", description="База данных для подключения к TimescaleDB")
 
-    class RabbitMq(BaseModel):
-        """ Класс для валидации настроек подключения в RabbitMQ
+class _RabbitMq(BaseModel):
+    """ Класс для валидации настроек подключения в RabbitMQ
 
-        Arguments:
-            BaseModel {_type_} -- Базовый класс для валидации данных
-        """
-        
-        host: Union[IPvAnyAddress, Literal["localhost"]] = Field(default="localhost", description="Ip адрес или имя хоста для подключения к RabbitMQ")
-        port: int = Field(ge=1, le=65535, default=5672, description="Порт для подключения к RabbitMQ")
-        username: str = Field(default="guest", description="Имя пользователя для подключения к RabbitMQ")
-        password: str = Field(default="guest", description="Пароль для подключения к RabbitMQ")
-        queue: str = Field(default="logs", description="Очередь для получения логов в RabbitMQ")
+    Arguments:
+        BaseModel {_type_} -- Базовый класс для валидации данных
+    """
     
-    class Logger(BaseModel):
-        project_name: str = Field(default="DefaultProject", description="Имя проекта для логирования")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     
-    class Console(BaseModel):
-        """ Класс для валидации настроек логирования в консоль
+    host: _Host = Field(default="localhost", description="Ip адрес или имя хоста для подключения к RabbitMQ")
+    port: int = Field(ge=1, le=65535, default=5672, description="Порт для подключения к RabbitMQ")
+    username: str = Field(default="guest", description="Имя пользователя для подключения к RabbitMQ")
+    password: str = Field(default="guest", description="Пароль для подключения к RabbitMQ")
+    queue: str = Field(default="logs", description="Очередь для получения логов в RabbitMQ")
+    prefetch_count: int = Field(default=100, ge=1, le=65535, description="Количество неподтверждённых сообщений, которые RabbitMQ отдаёт получателю заранее")
+    consumers: int = Field(default=1, ge=1, le=64, description="Количество получателей очереди логов (каждый на своём канале, prefetch_count делится между ними)")
+    heartbeat: int = Field(default=60, ge=0, le=3600, description="Интервал heartbeat соединения в секундах (0 - отключить)")
+    connect_timeout: float = Field(default=10, gt=0, description="Время ожидания подключения к RabbitMQ в секундах")
 
-        Arguments:
-            BaseModel {_type_} -- Базовый класс для валидации данных
-        """
-        
-        class Levels(BaseModel):
-            """ Класс для валидации настроек стилей у уровней логирования
-
-            Arguments:
-                BaseModel {_type_} -- Базовый класс для валидации данных
-            """
-            
-            info: str = Field(default="bold magenta", description="Rich стили для вывода уровня лога INFO")
-            warning: str = Field(default="bold yellow", description="Rich стили для вывода уровня лога WARNING")
-            error: str = Field(default="bold red", description="Rich стили для вывода уровня лога ERROR")
-            fatal: str = Field(default="bold white on red", description="Rich стили для вывода уровня лога FATAL")
-            debug: str = Field(default="dim cyan", description="Rich стили для вывода уровня лога DEBUG")
-            alert: str = Field(default="bold magenta", description="Rich стили для вывода уровня лога ALERT")
-            unknown: str = Field(default="bold white on red", description="Rich стили для вывода уровня лога UNKNOWN")
-            
-        enabled: bool = Field(default=True, description="Статус активации логирования в консоль")
-        format: str = Field(default="[{project}] [{timestamp}] [{level}] {module}.{function}: {message} [{code}]", description="Формат лог-записи при выводе в консоль")
-        
-        project_style: str = Field(default="bold cyan", description="Rich стили для вывода имени проекта")
-        timestamp_style: str = Field(default="dim cyan", description="Rich стили для вывода даты и времени лога-записи")
-        level_styles: Levels = Field(default_factory=Levels, description="Rich стили для вывода уровней лога-записи")
-        module_style: str = Field(default="green", description="Rich стили для вывода имени модуля лога-записи")
-        function_style: str = Field(default="magenta", description="Rich стили для вывода имени функции лога-записи")
-        message_style: str = Field(default="", description="Rich стили для вывода сообщения лога-записи")
-        code_style: str = Field(default="dim", description="Rich стили для вывода кода лога-записи")
-        
-        time_format: str = Field(default="%Y-%m-%d %H:%M:%S", description="Формат даты и времени при выводе в консоль")
-        time_zone: str = Field(default="UTC", description="Часовой пояс для форматирования времени")
-        
-    class Files(BaseModel):
-        """ Класс для валидации настроек логирования в файлы
 
-        Arguments:
-            BaseModel {_type_} -- Базовый класс для валидации данных
+class _Logger(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
+    project_name: str = Field(default="DefaultProject", description="Имя проекта для логирования")
+
+
+class _ConsoleLevels(BaseModel):
+    """ Класс для валидации настроек стилей у уровней логирования
+
+    Arguments:
+        BaseModel {_type_} -- Базовый класс для валидации данных
+    """
+    
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
+    info: str = Field(default="bold magenta", description="Rich стили для вывода уровня лога INFO")
+    warning: str = Field(default="bold yellow", description="Rich стили для вывода уровня лога WARNING")
+    error: str = Field(default="bold red", description="Rich стили для вывода уровня лога ERROR")
+    fatal: str = Field(default="bold white on red", description="Rich стили для вывода уровня лога FATAL")
+    debug: str = Field(default="dim cyan", description="Rich стили для вывода уровня лога DEBUG")
+    alert: str = Field(default="bold magenta", description="Rich стили для вывода уровня лога ALERT")
+    unknown: str = Field(default="bold white on red", description="Rich стили для вывода уровня лога UNKNOWN")
+
+
+class _Console(BaseModel):
+    """ Класс для валидации настроек логирования в консоль
+
+    Arguments:
+        BaseModel {_type_} -- Базовый класс для валидации данных
+    """
+    
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
+    Levels: ClassVar[type[_ConsoleLevels]] = _ConsoleLevels
+    
+    enabled: bool = Field(default=True, description="Статус активации логирования в консоль")
+    format: str = Field(default="[{project}] [{timestamp}] [{level}] {module}.{function}: {message} [{code}]", description="Формат лог-записи при выводе в консоль")
+    
+    project_style: str = Field(default="bold cyan", description="Rich стили для вывода имени проекта")
+    timestamp_style: str = Field(default="dim cyan", description="Rich стили для вывода даты и времени лога-записи")
+    level_styles: _ConsoleLevels = Field(default_factory=_ConsoleLevels, description="Rich стили для вывода уровней лога-записи")
+    module_style: str = Field(default="green", description="Rich стили для вывода имени модуля лога-записи")
+    function_style: str = Field(default="magenta", description="Rich стили для вывода имени функции лога-записи")
+    message_style: str = Field(default="", description="Rich стили для вывода сообщения лога-записи")
+    code_style: str = Field(default="dim", description="Rich стили для вывода кода лога-записи")
+    
+    time_format: str = Field(default="%Y-%m-%d %H:%M:%S", description="Формат даты и времени при выводе в консоль")
+    time_zone: str = Field(default="UTC", description="Часовой пояс для форматирования времени")
+    
+    _format_parts: Tuple[Tuple[str, Optional[str]], ...] = PrivateAttr(default=())
+    
+    def model_post_init(self, __context) -> None:
+        # Шаблон разбирается один раз при загрузке конфигурации, а не на каждое сообщение
+        self._format_parts = _template_parts(self.format)
+    
+    @property
+    def format_parts(self) -> Tuple[Tuple[str, Optional[str]], ...]:
+        """ Функция для получения разобранного шаблона вывода в консоль
+
+        Returns:
+            Tuple[Tuple[str, Optional[str]], ...] -- Пары (текст, имя поля или None)
         """
         
-        class Rotation(BaseModel):
-            """ Класс для валидации настроек смены файла логирования
-
-            Arguments:
-                BaseModel {_type_} -- Базовый класс для валидации данных
-            """
-            
-            trigger: Literal["time", "size", "daily", "lines"] = Field(default="daily", description="Триггер для смены файла логирования (time, size, daily, lines)")
-            time: int = Field(default=24400, ge=3600, description="Возраст лог-файла для активации триггера смены файла")
-            daily: str = Field(default="00:00", description="Время в формате 24H для активации триггера смены файла")
-            size: int = Field(default=10 * 1024 * 1024, ge=1024, description="Размер файла для активации триггера смены файла")
-            lines: int = Field(default=10000, description="Количество лог-записей для активации триггера смены файла")
-            
-        class Archive(BaseModel):
-            """ Класс для валидации настроек архивации лог-файлов
-
-            Arguments:
-                BaseModel {_type_} -- Базовый класс для валидации данных
-            """
-            
-            enabled: bool = Field(default=False, description="Статус активации архивации лог-файлов")
-            
-            type: Literal["zip", "tar", "gz", "bz2", "xz"] = Field(default="zip", description="Тип архива для сжатия (zip, tar, gz, bz2, xz)")
-            compression_level: int = Field(ge=0, le=9, default=6, description="Уровень сжатия архивов (0-9)")
-            directory: str = Field(default="archive", description="Директория для хранения архивов")
-            
-            trigger: Literal["age", "count"] = Field(default="count", description="Триггер для активации архивации лог-файлов")
-            count: int = Field(ge=1, default=10, description="Количество старых файлов для активации триггера архивации")
-            age: int = Field(default=10 * 24400, ge=24400, description="Возраст файла для активации триггера архивации (в секундах)")
-            
-        enabled: bool = Field(default=True, description="Статус активации логирования в файлы")
-        
-        shared_directory: str = Field(default="logs", description="Общая директория для хранения лог-файлов")
-        project_directory: str = Field(default="{project}", description="Паттерн для имени директории проекта")
-        filename: str = Field(default="log_{project}_{date}.log", description="Паттерн имени файла")
-        date_file_format: str = Field(default="%Y-%m-%d_%H-%M-%S", description="Формат даты в имени файла")
-        date_log_format: str = Field(default="%Y-%m-%d %H:%M:%S", description="Формат даты в лог-записях")
-        date_timezone: str = Field(default="UTC", description="Часовой пояс для даты в формате ISO 8601")
-        log_format: str = Field(default="[{project}] [{timestamp}] [{level}] {module}.{function}: {message} [{code}]", description="Формат лог-записи")
-        
-        rotation: Rotation = Field(default_factory=Rotation, description="Настройки смены файла для логирования записей")
-        archive: Archive = Field(default_factory=Archive, description="Настройки архивации старых лог-файлов")
+        return self._format_parts
+
+
+class _FilesRotation(BaseModel):
+    """ Класс для валидации настроек смены файла логирования
+
+    Arguments:
+        BaseModel {_type_} -- Базовый класс для валидации данных
+    """
     
-    class Api(BaseModel):
-        """ Функция для валидации настроек API
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
+    trigger: Literal["time", "size", "daily", "lines"] = Field(default="daily", description="Триггер для смены файла логирования (time, size, daily, lines)")
+    time: int = Field(default=24400, ge=3600, description="Возраст лог-файла для активации триггера смены файла")
+    daily: str = Field(default="00:00", description="Время в формате 24H для активации триггера смены файла")
+    size: int = Field(default=10 * 1024 * 1024, ge=1024, description="Размер файла для активации триггера смены файла")
+    lines: int = Field(default=10000, description="Количество лог-записей для активации триггера смены файла")
+
+
+class _FilesArchive(BaseModel):
+    """ Класс для валидации настроек архивации лог-файлов
+
+    Arguments:
+        BaseModel {_type_} -- Базовый класс для валидации данных
+    """
+    
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
+    enabled: bool = Field(default=False, description="Статус активации архивации лог-файлов")
+    
+    type: Literal["zip", "tar", "gz", "bz2", "xz"] = Field(default="zip", description="Тип архива для сжатия (zip, tar, gz, bz2, xz)")
+    compression_level: int = Field(ge=0, le=9, default=6, description="Уровень сжатия архивов (0-9)")
+    directory: str = Field(default="archive", description="Директория для хранения архивов")
+    
+    trigger: Literal["age", "count"] = Field(default="count", description="Триггер для активации архивации лог-файлов")
+    count: int = Field(ge=1, default=10, description="Количество старых файлов для активации триггера архивации")
+    age: int = Field(default=10 * 24400, ge=24400, description="Возраст файла для активации триггера архивации (в секундах)")
+
+
+class _Files(BaseModel):
+    """ Класс для валидации настроек логирования в файлы
+
+    Arguments:
+        BaseModel {_type_} -- Базовый класс для валидации данных
+    """
+    
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
+    Rotation: ClassVar[type[_FilesRotation]] = _FilesRotation
+    Archive: ClassVar[type[_FilesArchive]] = _FilesArchive
+    
+    enabled: bool = Field(default=True, description="Статус активации логирования в файлы")
+    
+    shared_directory: str = Field(default="logs", description="Общая директория для хранения лог-файлов")
+    project_directory: str = Field(default="{project}", description="Паттерн для имени директории проекта")
+    filename: str = Field(default="log_{project}_{date}.log", description="Паттерн имени файла")
+    date_file_format: str = Field(default="%Y-%m-%d_%H-%M-%S", description="Формат даты в имени файла")
+    date_log_format: str = Field(default="%Y-%m-%d %H:%M:%S", description="Формат даты в лог-записях")
+    date_timezone: str = Field(default="UTC", description="Часовой пояс для даты в формате ISO 8601")
+    log_format: str = Field(default="[{project}] [{timestamp}] [{level}] {module}.{function}: {message} [{code}]", description="Формат лог-записи")
+    
+    rotation: _FilesRotation = Field(default_factory=_FilesRotation, description="Настройки смены файла для логирования записей")
+    archive: _FilesArchive = Field(default_factory=_FilesArchive, description="Настройки архивации старых лог-файлов")
+    
+    def format_log(self, **fields) -> str:
+        """ Функция для форматирования лог-записи по шаблону log_format
 
         Arguments:
-            BaseModel {_type_} -- Базовый класс для валидации данных
+            fields {Any} -- Поля лог-записи (project, timestamp, level, module, function, message, code)
+
+        Returns:
+            str -- Отформатированная лог-запись
         """
         
-        class RabbitMq(BaseModel):
-            """ Класс для валидации настроек подключения к RabbitMQ
-
-            Arguments:
-                BaseModel {_type_} -- Базовый класс для валидации данных
-            """
-            
-            host: Union[IPvAnyAddress, Literal["localhost"]] = Field(default="localhost", description="Ip адрес или имя хоста для подключения к RabbitMQ")
-            port: int = Field(ge=1, le=65535, default=5672, description="Порт для подключения к RabbitMQ")
-            username: str = Field(default="guest", description="Имя пользователя для подключения к RabbitMQ")
-            password: str = Field(default="guest", description="Пароль для подключения к RabbitMQ")
-            
-        class Routers(BaseModel):
-            """ Класс для валидации настроек ручки для получения логов
-
-            Arguments:
-                BaseModel {_type_} -- Базовый класс для валидации данных
-            """
-                
-            logs: bool = Field(default=False, description="Статус активации ручки для получения логов")
-            config: bool = Field(default=False, description="Статус активации ручки для работы с конфигурацией проекта")
-            health: bool = Field(default=True, description="Статус активации ручки для проверки работоспособности проекта")
-        
-        class Auth(BaseModel):
-            """ Класс для валидации настроек аутентификации запросов
-
-            Arguments:
-                BaseModel {_type_} -- Базовый класс для валидации данных
-            """
-            
-            enabled: bool = Field(default=False, description="Статус активации аутентификации запросов")
-            secret: str = Field(default="secret", description="Секрет для аутентификации запросов")
-        
-        enabled: bool = Field(default=False, description="Статус активации получения логов через API")
-        host: Union[IPvAnyAddress, Literal["localhost"]] = Field(default="localhost", description="Ip адрес или имя хоста для запуска API")
-        port: int = Field(ge=1, le=65535, default=8000, description="Порт для запуска API")
-        rabbitmq: RabbitMq = Field(default_factory=RabbitMq, description="Настройки для отправки служебных сообщений через RabbitMq")
-        routers: Routers = Field(default_factory=Routers, description="Настройки путей API")
-        auth: Auth = Field(default_factory=Auth, description="Настройки аутентификации запросов")
-        
-        
+        # Без приватного атрибута: связанный метод строки сравнивается по объекту и ломал бы равенство моделей
+        return self.log_format.format_map(fields)
+
+
+class _ApiRabbitMq(BaseModel):
+    """ Класс для валидации настроек подключения к RabbitMQ
+
+    Arguments:
+        BaseModel {_type_} -- Базовый класс для валидации данных
+    """
+    
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
+    host: _Host = Field(default="localhost", description="Ip адрес или имя хоста для подключения к RabbitMQ")
+    port: int = Field(ge=1, le=65535, default=5672, description="Порт для подключения к RabbitMQ")
+    username: str = Field(default="guest", description="Имя пользователя для подключения к RabbitMQ")
+    password: str = Field(default="guest", description="Пароль для подключения к RabbitMQ")
+
+
+class _ApiRouters(BaseModel):
+    """ Класс для валидации настроек ручки для получения логов
+
+    Arguments:
+        BaseModel {_type_} -- Базовый класс для валидации данных
+    """
+    
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
+    logs: bool = Field(default=False, description="Статус активации ручки для получения логов")
+    config: bool = Field(default=False, description="Статус активации ручки для работы с конфигурацией проекта")
+    health: bool = Field(default=True, description="Статус активации ручки для проверки работоспособности проекта")
+
+
+class _ApiAuth(BaseModel):
+    """ Класс для валидации настроек аутентификации запросов
+
+    Arguments:
+        BaseModel {_type_} -- Базовый класс для валидации данных
+    """
+    
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
+    enabled: bool = Field(default=False, description="Статус активации аутентификации запросов")
+    secret: str = Field(default="secret", description="Секрет для аутентификации запросов")
+
+
+class _Api(BaseModel):
+    """ Функция для валидации настроек API
+
+    Arguments:
+        BaseModel {_type_} -- Базовый класс для валидации данных
+    """
+    
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
+    RabbitMq: ClassVar[type[_ApiRabbitMq]] = _ApiRabbitMq
+    Routers: ClassVar[type[_ApiRouters]] = _ApiRouters
+    Auth: ClassVar[type[_ApiAuth]] = _ApiAuth
+    
+    enabled: bool = Field(default=False, description="Статус активации получения логов через API")
+    host: _Host = Field(default="localhost", description="Ip адрес или имя хоста для запуска API")
+    port: int = Field(ge=1, le=65535, default=8000, description="Порт для запуска API")
+    reload: bool = Field(default=False, description="Перезапуск API при изменении файлов (только для разработки, только при отдельном запуске API)")
+    rabbitmq: _ApiRabbitMq = Field(default_factory=_ApiRabbitMq, description="Настройки для отправки служебных сообщений через RabbitMq")
+    routers: _ApiRouters = Field(default_factory=_ApiRouters, description="Настройки путей API")
+    auth: _ApiAuth = Field(default_factory=_ApiAuth, description="Настройки аутентификации запросов")
+
+
+class ServerConfig(BaseModel):
+    """ Класс для валидации настроек сервера
+
+    Arguments:
+        BaseModel {_type_} -- Базовый класс для валидации данных
+    """
+    
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
+    # Прежние имена вложенных моделей (ServerConfig.TimescaleDB и т.д.) остаются доступны
+    TimescaleDB: ClassVar[type[_TimescaleDB]] = _TimescaleDB
+    RabbitMq: ClassVar[type[_RabbitMq]] = _RabbitMq
+    Logger: ClassVar[type[_Logger]] = _Logger
+    Console: ClassVar[type[_Console]] = _Console
+    Files: ClassVar[type[_Files]] = _Files
+    Api: ClassVar[type[_Api]] = _Api
     
-    rabbitmq: RabbitMq = Field(default_factory=RabbitMq, description="Настройки для подключения к RabbitMQ")
-    timescaledb: TimescaleDB = Field(default_factory=TimescaleDB, description="Настройки для подключения к TimescaleDB")
-    logger: Logger = Field(default_factory=Logger, description="Общие настройки логирования")
-    console: Console = Field(default_factory=Console, description="Настройки для вывода логов в консоль")
-    files: Files = Field(default_factory=Files, description="Настройки для логирования в файлы")
-    api: Api = Field(default_factory=Api, description="Настройки для модуля REST-full API")
+    rabbitmq: _RabbitMq = Field(default_factory=_RabbitMq, description="Настройки для подключения к RabbitMQ")
+    timescaledb: _TimescaleDB = Field(default_factory=_TimescaleDB, description="Настройки для подключения к TimescaleDB")
+    logger: _Logger = Field(default_factory=_Logger, description="Общие настройки логирования")
+    console: _Console = Field(default_factory=_Console, description="Настройки для вывода логов в консоль")
+    files: _Files = Field(default_factory=_Files, description="Настройки для логирования в файлы")
+    api: _Api = Field(default_factory=_Api, description="Настройки для модуля REST-full API")
+
+
+class _LibraryRabbit(BaseModel):
+    """ Класс для валидации настроек подключения к RabbitMQ
+
+    Arguments:
+        BaseModel {_type_} -- Базовый класс для валидации данных
+    """
+    
+    model_config = ConfigDict(extra="forbid", frozen=True)
     
-    class Config:
-        extra = "forbid"
+    enabled: bool = Field(default=False, description="Статус активации логирования в RabbitMQ")
+    host: _Host = Field(default="localhost", description="Ip адрес или имя хоста для подключения к RabbitMQ")
+    port: int = Field(ge=1, le=65535, default=5672, description="Порт для подключения к RabbitMQ")
+    username: str = Field(default="guest", description="Имя пользователя для подключения к RabbitMQ")
+    password: str = Field(default="guest", description="Пароль для подключения к RabbitMQ")
+    queue: str = Field(default="logs", description="Очередь для логирования в RabbitMQ")
+
+
+class _LibraryConsole(BaseModel):
+    """ Класс для валидации настроек вывода логов в консоль
+
+    Arguments:
+        BaseModel {_type_} -- Базовый класс для валидации данных
+    """
+    
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
+    Levels: ClassVar[type[_ConsoleLevels]] = _ConsoleLevels
+    
+    enabled: bool = Field(default=True, description="Статус активации логирования в консоль")
+    format: str = Field(default="[{timestamp}] [{level}] {module}.{function}: {message} [{code}]", description="Паттерн вывода лог-записи в консоль")
+    
+    timestamp_style: str = Field(default="dim cyan", description="Rich стиль для вывода даты и времени")
+    level_styles: _ConsoleLevels = Field(default_factory=_ConsoleLevels, description="Rich стили для вывода уровней лога")
+    module_style: str = Field(default="green", description="Rich стиль для вывода имени модуля")
+    function_style: str = Field(default="magenta", description="Rich стиль для вывода имени функции")
+    message_style: str = Field(default="", description="Rich стиль для вывода сообщения")
+    code_style: str = Field(default="dim", description="Rich стиль для вывода кода ошибки")
+    
+    time_format: str = Field(default="%Y-%m-%d %H:%M:%S", description="Формат даты и времени в лог-записях")
+    time_zone: str = Field(default="UTC", description="Часовой пояс для даты в формате ISO 8601")
 
 
 # Класс для валидации настроек библиотеки
@@ -198,59 +383,65 @@ class LibraryConfig(BaseModel):
         BaseModel {_type_} -- Базовый класс для валидации данных
     """
     
-    class Rabbit(BaseModel):
-        """ Класс для валидации настроек подключения к RabbitMQ
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
+    # Прежние имена вложенных моделей (LibraryConfig.Rabbit и т.д.) остаются доступны
+    Rabbit: ClassVar[type[_LibraryRabbit]] = _LibraryRabbit
+    Console: ClassVar[type[_LibraryConsole]] = _LibraryConsole
+    
+    project_name: str = Field(default="DefaultProject", description="Имя проекта для логирования")
+    rabbitmq: _LibraryRabbit = Field(default_factory=_LibraryRabbit, description="Настройки для подключения к RabbitMQ")
+    console: _LibraryConsole = Field(default_factory=_LibraryConsole, description="Настройки для вывода логов в консоль")
 
-        Arguments:
-            BaseModel {_type_} -- Базовый класс для валидации данных
-        """
-        
-        enabled: bool = Field(default=False, description="Статус активации логирования в RabbitMQ")
-        host: Union[IPvAnyAddress, Literal["localhost"]] = Field(default="localhost", description="Ip адрес или имя хоста для подключения к RabbitMQ")
-        port: int = Field(ge=1, le=65535, default=5672, description="Порт для подключения к RabbitMQ")
-        username: str = Field(default="guest", description="Имя пользователя для подключения к RabbitMQ")
-        password: str = Field(default="guest", description="Пароль для подключения к RabbitMQ")
-        queue: str = Field(default="logs", description="Очередь для логирования в RabbitMQ")
-       
-    class Console(BaseModel):  
-        """ Класс для валидации настроек вывода логов в консоль
 
-        Arguments:
-            BaseModel {_type_} -- Базовый класс для валидации данных
-        """
- 
-        class Levels(BaseModel):
-            """ Класс для валидации настроек стилей у уровней логирования
-
-            Arguments:
-                BaseModel {_type_} -- Базовый класс для валидации данных
-            """
-            
-            info: str = Field(default="bold magenta", description="Rich стили для вывода уровня лога INFO")
-            warning: str = Field(default="bold yellow", description="Rich стили для вывода уровня лога WARNING")
-            error: str = Field(default="bold red", description="Rich стили для вывода уровня лога ERROR")
-            fatal: str = Field(default="bold white on red", description="Rich стили для вывода уровня лога FATAL")
-            debug: str = Field(default="dim cyan", description="Rich стили для вывода уровня лога DEBUG")
-            alert: str = Field(default="bold magenta", description="Rich стили для вывода уровня лога ALERT")
-            unknown: str = Field(default="bold white on red", description="Rich стили для вывода уровня лога UNKNOWN")
-    
-        enabled: bool = Field(default=True, description="Статус активации логирования в консоль")
-        format: str = Field(default="[{timestamp}] [{level}] {module}.{function}: {message} [{code}]", description="Паттерн вывода лог-записи в консоль")
-        
-        timestamp_style: str = Field(default="dim cyan", description="Rich стиль для вывода даты и времени")
-        level_styles: Levels = Field(default_factory=Levels, description="Rich стили для вывода уровней лога")
-        module_style: str = Field(default="green", description="Rich стиль для вывода имени модуля")
-        function_style: str = Field(default="magenta", description="Rich стиль для вывода имени функции")
-        message_style: str = Field(default="", description="Rich стиль для вывода сообщения")
-        code_style: str = Field(default="dim", description="Rich стиль для вывода кода ошибки")
-        
-        time_format: str = Field(default="%Y-%m-%d %H:%M:%S", description="Формат даты и времени в лог-записях")
-        time_zone: str = Field(default="UTC", description="Часовой пояс для даты в формате ISO 8601")
+# Предкомпилированные валидаторы настроек сервера и библиотеки (схемы строятся один раз при импорте модуля)
+_SERVER_ADAPTER = TypeAdapter(ServerConfig)
+_LIBRARY_ADAPTER = TypeAdapter(LibraryConfig)
+
+
+def validate_server(data: dict) -> ServerConfig:
+    """ Функция для валидации настроек сервера через предкомпилированный валидатор
+
+    Arguments:
+        data {dict} -- Словарь с настройками сервера
+
+    Raises:
+        ValidationError: Ошибка валидации настроек
+
+    Returns:
+        ServerConfig -- Провалидированные настройки сервера
+    """
     
-    project_name: str = Field(default="DefaultProject", description="Имя проекта для логирования")
-    rabbitmq: Rabbit = Field(default_factory=Rabbit, description="Настройки для подключения к RabbitMQ")
-    console: Console = Field(default_factory=Console, description="Настройки для вывода логов в консоль")
+    return _SERVER_ADAPTER.validate_python(data)
+
+
+def validate_server_json(raw: bytes) -> ServerConfig:
+    """ Функция для валидации настроек сервера напрямую из JSON (разбор и валидация за один проход)
+
+    Arguments:
+        raw {bytes} -- JSON с настройками сервера
+
+    Raises:
+        ValidationError: Ошибка разбора JSON или валидации настроек
+
+    Returns:
+        ServerConfig -- Провалидированные настройки сервера
+    """
     
+    return _SERVER_ADAPTER.validate_json(raw)
+
 
-    class Config:
-        extra = "forbid"
\ No newline at end of file
+def validate_library(data: dict) -> LibraryConfig:
+    """ Функция для валидации настроек библиотеки через предкомпилированный валидатор
+
+    Arguments:
+        data {dict} -- Словарь с настройками библиотеки
+
+    Raises:
+        ValidationError: Ошибка валидации настроек
+
+    Returns:
+        LibraryConfig -- Провалидированные настройки библиотеки
+    """
+    
+    return _LIBRARY_ADAPTER.validate_python(data)
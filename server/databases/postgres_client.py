@@ -1,20 +1,96 @@
 # app/server/databases/postgres_client.py
 # Модуль для работы с PostgreSQL / TimeScaleDB
 
+from contextlib import asynccontextmanager
+import logging
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Type, Union
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Type, Union
 from urllib.parse import quote_plus
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import Select, delete, inspect, insert, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.sql import text
 
 from server.config.schema import ServerConfig
 
+logger = logging.getLogger(__name__)
+
+_POOL_SIZE = 20         # Количество постоянных соединений в пуле (по умолчанию)
+_MAX_OVERFLOW = 20      # Дополнительные соединения сверх пула при пиковой нагрузке (по умолчанию)
+_POOL_RECYCLE = 1800    # Время жизни соединения в пуле (в секундах, по умолчанию)
+_POOL_TIMEOUT = 30.0    # Время ожидания свободного соединения из пула (в секундах, по умолчанию)
+_QUERY_CACHE_SIZE = 1200  # Размер кэша скомпилированных SQL-выражений движка
+_STATEMENT_CACHE_SIZE = 1024  # Размер кэша подготовленных выражений на каждое соединение asyncpg
+
+
+@lru_cache(maxsize=None)
+def _base_select(model: Type) -> Any:
+    """ Функция для получения базового запроса select(model) (строится один раз на модель)
+
+    Arguments:
+        model {Type} -- Модель SqlAlchemy
+
+    Returns:
+        Any -- Запрос select(model); where / filter_by возвращают новые объекты и не изменяют его
+    """
+    
+    return select(model)
+
+
+@lru_cache(maxsize=256)
+def _filter_by_select(model: Type, filter_by: tuple) -> Any:
+    """ Функция для получения запроса select(model) с фильтрами по полям (кэшируется для повторяющихся фильтров)
+
+    Arguments:
+        model {Type} -- Модель SqlAlchemy
+        filter_by {tuple} -- Отсортированные тройки (поле, значение, тип значения)
+
+    Returns:
+        Any -- Запрос select(model).filter_by(...)
+    """
+    
+    return _base_select(model).filter_by(**{key: value for key, value, _ in filter_by})
+
+
+@lru_cache(maxsize=256)
+def _text(query: str) -> Any:
+    """ Функция для получения TextClause по строке запроса (разбор строки выполняется один раз на запрос)
+
+    Arguments:
+        query {str} -- SQL-запрос
+
+    Returns:
+        Any -- Объект text(query)
+    """
+    
+    return text(query)
+
+
+@lru_cache(maxsize=None)
+def _column_keys(model: Type) -> frozenset:
+    """ Функция для получения имён колонок модели (вычисляется один раз на модель)
+
+    Arguments:
+        model {Type} -- Модель SqlAlchemy
+
+    Returns:
+        frozenset -- Имена атрибутов-колонок модели
+    """
+    
+    return frozenset(column.key for column in inspect(model).column_attrs)
+
 
 class Client:
-    def __init__(self, config: ServerConfig.TimescaleDB) -> None:
+    def __init__(
+        self,
+        config: ServerConfig.TimescaleDB,
+        pool_size: int = _POOL_SIZE,
+        max_overflow: int = _MAX_OVERFLOW,
+        pool_recycle: int = _POOL_RECYCLE,
+        pool_timeout: float = _POOL_TIMEOUT
+    ) -> None:
         # Установка значений переменных
         self.host = config.host
         self.port = config.port
@@ -22,14 +98,26 @@ class Client:
         self.password = config.password
         self.database = config.database
 
+        # Настройки пула соединений движка
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_recycle = pool_recycle
+        self.pool_timeout = pool_timeout
+
+        # Строка подключения собирается один раз и переиспользуется при переподключениях
+        self._url = f"postgresql+asyncpg://{self.username}:{quote_plus(self.password)}@{self.host}:{self.port}/{self.database}"
+
         # Служебные переменные
         self.connected = False
         self.engine = None
-        self.async_session: Optional[sessionmaker] = None
+        self.async_session: Optional[async_sessionmaker] = None
         
         self._last_check: datetime = datetime.min
+        self._last_check_time: float = 0.0  # Время последнего подключения по монотонным часам (для таймера)
         self._reconnect_interval = timedelta(minutes=30)
+        self._reconnect_interval_seconds: float = self._reconnect_interval.total_seconds()
         self._reconnect_state = False
+        self._created_tables: set = set()  # Модели, чьи таблицы уже проверены / созданы этим клиентом
 
     # Добавление таймера на переподключение
     async def add_timer_reconnect(self, interval: int = 30, state: bool = False) -> bool:
@@ -45,6 +133,7 @@ class Client:
         
         if state:
             self._reconnect_interval = timedelta(minutes=interval)
+            self._reconnect_interval_seconds = self._reconnect_interval.total_seconds()
             self._reconnect_state = True
             return True
         else:
@@ -70,6 +159,12 @@ class Client:
                 "password": self.password,
                 "database": self.database
             },
+            "pool": {
+                "size": self.pool_size,
+                "max_overflow": self.max_overflow,
+                "recycle": self.pool_recycle,
+                "timeout": self.pool_timeout
+            },
             "timer": {
                 "state": self._reconnect_state,
                 "interval": self._reconnect_interval.seconds // 60,
@@ -86,28 +181,40 @@ class Client:
         """
         
         try:
+            if self.engine is None:
+                # Инициализация асинхронного движка SQLAlchemy и фабрики сессий
+                self.engine = create_async_engine(
+                    self._url,
+                    echo=False,
+                    pool_size=self.pool_size,
+                    max_overflow=self.max_overflow,
+                    pool_recycle=self.pool_recycle,
+                    pool_timeout=self.pool_timeout,
+                    pool_pre_ping=True,
+                    query_cache_size=_QUERY_CACHE_SIZE,
+                    # Повторяющиеся запросы (в том числе из manual_execute) не подготавливаются заново на соединении
+                    connect_args={
+                        "prepared_statement_cache_size": _STATEMENT_CACHE_SIZE,
+                        "statement_cache_size": _STATEMENT_CACHE_SIZE
+                    }
+                )
+                self.async_session = async_sessionmaker(self.engine, expire_on_commit=False)
+            else:
+                # Переподключение: соединения пула закрываются, движок и фабрика сессий сохраняются
+                await self.engine.dispose()
 
-            # Преобразование пароля
-            quoted_password = quote_plus(self.password) #type: ignore
-
-            # Формирование строки подключения в зависимости от типа СУБД
-            url = f"postgresql+asyncpg://{self.username}:{quoted_password}@{self.host}:{self.port}/{self.database}"
-
-            # Инициализация асинхронного движка SQLAlchemy
-            self.engine = create_async_engine(url, echo=False, pool_pre_ping=True)
-
-            # Тест запроса на подключение
-            async with self.engine.connect() as conn:
-                _ = await conn.execute(text("SELECT 1"))
+            # Проверка подключения: открытие соединения (оно остаётся в пуле) без отдельного запроса SELECT 1;
+            # дальше живость соединений при выдаче из пула проверяет pool_pre_ping
+            async with self.engine.connect():
+                pass
 
-            # Создание асинхронной сессии
-            self.async_session = sessionmaker(self.engine, expire_on_commit=False, class_=AsyncSession) #type: ignore
             self.connected = True
             self._last_check = datetime.now()
+            self._last_check_time = time.monotonic()
 
             return True
         except Exception as e:
-            await self.handle_error(e)
+            self.handle_error(e)
             self.connected = False
             return False
 
@@ -120,24 +227,31 @@ class Client:
         """
         
         try:
-            # Проверка активного соединения
-            if self.connected:
+            # Движок закрывается и после неудачного подключения: его пул мог успеть открыть соединения
+            if self.engine is not None:
                 self._last_check = datetime.now()
 
-                # Проверка активной сессии
-                # Закрываем двигатель, что приведет к закрытию всех активных сессий
-                if self.engine:
-                    await self.engine.dispose()
-                    self.engine = None
-                    self.connected = False
+                # Закрываем все соединения пула и дожидаемся их завершения
+                await self.engine.dispose()
+                self.engine = None
+                self.async_session = None
 
-                    print(f"Disconnected from {self.host}:{self.port}")
-                    return True
+                if self.connected:
+                    self.connected = False
+                    logger.info("Disconnected from %s:%s", self.host, self.port)
             return True
         except Exception as e:
-            await self.handle_error(e)
+            self.handle_error(e)
             return False
 
+    # Использование клиента как асинхронного контекстного менеджера
+    async def __aenter__(self) -> "Client":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.disconnect()
+
     # Проверка подключения или переподключение при истечении таймера
     async def connect_state(self) -> bool:
         """ Функция для проверки подключения к БД
@@ -146,14 +260,37 @@ class Client:
             bool -- Статус подключения
         """
         
+        # Быстрый путь: подключение есть и таймер переподключения выключен
+        if self.connected and not self._reconnect_state:
+            return True
+        
         if not self.connected:
             await self.connect()
-        
-        if self._reconnect_state and datetime.now() - self._last_check > self._reconnect_interval:
+        elif time.monotonic() - self._last_check_time > self._reconnect_interval_seconds:
             await self.connect()
             
         return self.connected
 
+    # Долгоживущая сессия для серии запросов
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """ Функция для получения одной сессии на серию запросов (например, на пачку логов)
+
+        Фиксация транзакции остаётся за вызывающим кодом: методы, принимающие session,
+        выполняют запросы в ней без собственного commit.
+
+        Raises:
+            ConnectionError: Нет подключения к БД
+
+        Returns:
+            AsyncIterator[AsyncSession] -- Асинхронная сессия SqlAlchemy
+        """
+        
+        if not await self.connect_state():
+            raise ConnectionError(f"Нет подключения к БД {self.host}:{self.port}")
+        async with self.async_session() as session: #type: ignore
+            yield session
+
     # Создание таблицы модели, если она ещё не существует
     async def create_table_if_not_exists(self, model: Type) -> bool:
         """ Функция для создания таблицы в БД, если она ещё не существует
@@ -170,11 +307,27 @@ class Client:
         try:
             async with self.engine.begin() as conn: #type: ignore
                 await conn.run_sync(lambda sync_conn: model.__table__.create(bind=sync_conn, checkfirst=True))
+            self._created_tables.add(model)
             return True
         except Exception as e:
-            await self.handle_error(e)
+            self.handle_error(e)
             return False
 
+    # Создание таблицы модели только при первом обращении
+    async def ensure_table(self, model: Type) -> bool:
+        """ Функция для создания таблицы модели один раз на клиент (без запроса к каталогу БД на каждую вставку)
+
+        Arguments:
+            model {Type} -- Модель SqlAlchemy
+
+        Returns:
+            bool -- Статус наличия таблицы
+        """
+        
+        if model in self._created_tables:
+            return True
+        return await self.create_table_if_not_exists(model=model)
+
     # Выборка моделей из БД с фильтрацией (ORM)
     async def select_model(self, model: Type, *filters: Any, filter_by: Optional[Dict[str, Any]] = None, fetch_many: bool = False) -> Optional[Any] | List[Any] | None:
         """ Функция для выборки моделей из БД с фильтрацией
@@ -197,17 +350,49 @@ class Client:
         try:
             async with self.async_session() as session: #type: ignore
                 # Генерация фильтров
-                stmt = await self.add_filters(model, *filters, filter_by=filter_by)
+                stmt = self.add_filters(model, *filters, filter_by=filter_by)
+                if not fetch_many:
+                    stmt = stmt.limit(1)  # Для одной записи БД не передаёт и не гидрирует остальные строки
 
                 # Получение записи на основе фильтров
-                result = await session.execute(stmt)
-                items = result.scalars()
+                items = await session.scalars(stmt)
         
                 return items.all() if fetch_many else items.first()
         except Exception as e:
-            await self.handle_error(e)
+            self.handle_error(e)
             return None
 
+    # Потоковая выборка строк из БД с фильтрацией (Core, без ORM-моделей)
+    async def select_model_stream(self, model: Type, *filters: Any, filter_by: Optional[Dict[str, Any]] = None, batch_size: int = 1000) -> AsyncIterator[Mapping[str, Any]]:
+        """ Функция для потоковой выборки строк из БД с фильтрацией (серверный курсор, строки читаются пачками)
+
+        Строки не превращаются в модели и не попадают в identity map сессии:
+        возвращаются представления RowMapping поверх уже разобранных данных драйвера.
+
+        Arguments:
+            model {Type} -- Модель для выборки SqlAlchemy
+
+        Keyword Arguments:
+            filters {Any} -- Фильтры для выборки (default: {None})
+            filter_by {Optional[Dict[str, Any]]} -- Фильтры для выборки по полям (default: {None})
+            batch_size {int} -- Количество строк, читаемых из курсора за раз (default: {1000})
+
+        Returns:
+            AsyncIterator[Mapping[str, Any]] -- Асинхронный итератор строк (колонка -> значение)
+        """
+        
+        if not await self.connect_state():
+            return
+
+        try:
+            stmt = self.add_filters(model, *filters, filter_by=filter_by).execution_options(yield_per=batch_size)
+            async with self.engine.connect() as conn: #type: ignore
+                result = await conn.stream(stmt)
+                async for row in result.mappings():
+                    yield row
+        except Exception as e:
+            self.handle_error(e)
+
     # Вставка записи по переданным полям
     async def insert_model(self, model: Type, data: List[dict], fetch_many: bool = False) -> Optional[Any] | List[Any] | None:
         """ Функция для вставки записи в БД
@@ -227,24 +412,20 @@ class Client:
             return None
 
         try:
-            async with self.async_session() as session: #type: ignore
-                if fetch_many:
-                    result = []
-                    for item in data:
-                        instance = model(**item)
-                        session.add(instance)
-                        await session.commit()
-                        await session.refresh(instance)  # Обновляем данные из БД
-                        result.append(instance)
-                    return result
-                else:
-                    instance = model(**data[0])
-                    session.add(instance)
-                    await session.commit()
-                    await session.refresh(instance)  # Обновляем данные из БД
-                    return instance
+            rows = data if fetch_many else data[:1]
+            if not rows:
+                return [] if fetch_many else None
+            
+            # Транзакция фиксируется при выходе из блока begin() (откатывается при исключении)
+            async with self.async_session.begin() as session: #type: ignore
+                # Один INSERT ... RETURNING на все записи и одна фиксация транзакции
+                # (вместо commit + refresh на каждую запись); порядок результата совпадает с порядком data
+                stmt = insert(model).returning(model, sort_by_parameter_order=True)
+                instances = (await session.scalars(stmt, rows)).all()
+                
+                return list(instances) if fetch_many else instances[0]
         except Exception as e:
-            await self.handle_error(e)
+            self.handle_error(e)
             return None
 
     # Функция частичного обновления записи
@@ -267,43 +448,25 @@ class Client:
             return None
 
         try:
-            async with self.async_session() as session:  # type: ignore
-                # Генерация фильтров
-                stmt = await self.add_filters(model, *filters, filter_by=filter_by)
-
-                # Запрашиваем нужные записи
-                result = await session.execute(stmt)
-                instances = result.scalars().all()  # Все записи, подходящие под фильтр
-
-                # Массив обновленных экземпляров
-                updated_instances = []
-
-                # Применяем новые данные ко всем экземплярам
-                for i, instance in enumerate(instances):
-                    # Обновляем только первые найденные, если нужен единичный вариант
-                    if not fetch_many and i > 0:
-                        break
-
-                    # Обновляем атрибуты записи новыми значениями
-                    for key, value in new_data.items():
-                        if hasattr(instance, key):
-                            setattr(instance, key, value)
-
-                    updated_instances.append(instance)
-
-                # Сохраняем изменения
-                await session.commit()
-                for instance in updated_instances:
-                    await session.refresh(instance)  # Обновляем состояние модели из базы
+            # Обновляются только колонки модели (набор колонок закэширован для каждой модели)
+            columns = _column_keys(model)
+            values = {key: value for key, value in new_data.items() if key in columns}
+            if not values:
+                return await self.select_model(model, *filters, filter_by=filter_by, fetch_many=fetch_many)
+            
+            async with self.async_session.begin() as session:  # type: ignore
+                # Один UPDATE ... RETURNING вместо выборки, изменения и refresh каждой записи
+                stmt = self._filter_statement(update(model), model, *filters, filter_by=filter_by, fetch_many=fetch_many)
+                instances = (await session.scalars(stmt.values(**values).returning(model))).all()
 
                 # Возвращаем результаты в зависимости от флага
                 if fetch_many:
-                    return updated_instances
+                    return list(instances)
                 else:
-                    return updated_instances[0] if updated_instances else None
+                    return instances[0] if instances else None
 
         except Exception as e:
-            await self.handle_error(e)
+            self.handle_error(e)
             return None
         
     # Удаление записи по фильтрам
@@ -325,37 +488,19 @@ class Client:
             return None
 
         try:
-            async with self.async_session() as session:  # type: ignore
-                # Генерация фильтров
-                stmt = await self.add_filters(model, *filters, filter_by=filter_by)
-
-                # Получение записей на основе фильтров
-                result = await session.execute(stmt)
-                instances = result.scalars().all()  # Все записи, подходящие под фильтр
-
-                deleted_instances = []  # Будущие удалённые записи
-
-                # Проходим по каждой записи
-                for i, instance in enumerate(instances):
-                    # Только первую запись, если единичное удаление
-                    if not fetch_many and i > 0:
-                        break
-
-                    # Удаляем экземпляр
-                    await session.delete(instance)
-                    deleted_instances.append(instance)
-
-                # Сохраняем изменения
-                await session.commit()
+            async with self.async_session.begin() as session:  # type: ignore
+                # Один DELETE ... RETURNING вместо выборки и удаления каждой записи
+                stmt = self._filter_statement(delete(model), model, *filters, filter_by=filter_by, fetch_many=fetch_many)
+                instances = (await session.scalars(stmt.returning(model))).all()
 
                 # Возвращаем результат в зависимости от параметра fetch_many
                 if fetch_many:
-                    return deleted_instances
+                    return list(instances)
                 else:
-                    return deleted_instances[0] if deleted_instances else None
+                    return instances[0] if instances else None
 
         except Exception as e:
-            await self.handle_error(e)
+            self.handle_error(e)
             return None
         
     # Выполнение произвольного SQL-запроса
@@ -378,41 +523,43 @@ class Client:
             return None
 
         try:
-            # Открытие сессии и выполнение запроса
-            async with self.async_session() as session:  # type: ignore
-                async with session.begin():  # Начинаем транзакцию
-                    result = await session.execute(text(query), params)
+            # Открытие сессии с транзакцией (фиксация при выходе из блока) и выполнение запроса
+            async with self.async_session.begin() as session:  # type: ignore
+                result = await session.execute(_text(query), params)
 
-                    # Если результат не возвращает строки (например, INSERT, UPDATE, DELETE),
-                    # проверяем наличие ключа 'rowcount', который доступен для некоторых запросов
-                    if not response:
-                        return None
+                # Если результат не возвращает строки (например, INSERT, UPDATE, DELETE),
+                # проверяем наличие ключа 'rowcount', который доступен для некоторых запросов
+                if not response:
+                    return None
 
-                    # Иначе пытаемся собрать результат, если запрос возвращает строки
-                    keys = result.keys()
-                    rows = [dict(zip(keys, row)) for row in result]
+                # Иначе собираем результат из готовых представлений строк (RowMapping), без zip по ключам
+                mappings = result.mappings()
 
-                    # Возвращаем результат в зависимости от параметра fetch_many
-                    return (rows[0] if rows else None) if not fetch_many else (rows if rows else None)
+                # Возвращаем результат в зависимости от параметра fetch_many
+                if not fetch_many:
+                    row = mappings.first()  # Остальные строки не разбираются
+                    return dict(row) if row else None
+                rows = [dict(row) for row in mappings]
+                return rows if rows else None
 
         except Exception as e:
-            await self.handle_error(e)
+            self.handle_error(e)
             return None
 
     # Обработка и вывод ошибок
     @staticmethod
-    async def handle_error(error: Exception) -> None:
-        """ Обработка и вывод ошибок
+    def handle_error(error: Exception) -> None:
+        """ Обработка и вывод ошибок (вызывается из блока except, в лог попадает traceback)
 
         Arguments:
             error {Exception} -- Ошибка
         """
         
-        print(error)
+        logger.exception("Ошибка при работе с БД: %s", error)
 
     # Применение фильтров
     @staticmethod
-    async def add_filters(model: Type, *filters: Any, filter_by: Optional[Dict[str, Any]] = None) -> None:
+    def add_filters(model: Type, *filters: Any, filter_by: Optional[Dict[str, Any]] = None) -> Select:
         """ Функция для применения фильтров
 
         Arguments:
@@ -422,19 +569,53 @@ class Client:
             filter_by {Optional[Dict[str, Any]]} -- Фильтрация по полям (default: {None})
 
         Returns:
-            _type_ -- Возвращает объект запроса
+            Select -- Запрос select(model) с применёнными фильтрами
         """
         
-        stmt = select(model)
-
-        # Объединяем два варианта фильтрации в одном условии
-        if filters or filter_by:
-            if filters:
-                stmt = stmt.where(*filters)
-            if filter_by:
+        stmt = _base_select(model)
+
+        # Фильтры по полям: запрос для повторяющегося набора значений берётся из кэша
+        # (SQL-выражения из filters кэширует сам SqlAlchemy по их cache key при компиляции)
+        if filter_by:
+            try:
+                # Тип значения входит в ключ, чтобы 1 и True (равные по хэшу) не давали один запрос
+                stmt = _filter_by_select(model, tuple(sorted((key, value, type(value)) for key, value in filter_by.items())))
+            except TypeError:  # Нехэшируемые значения (списки, словари) - строим запрос без кэша
                 stmt = stmt.filter_by(**filter_by)
+        if filters:
+            stmt = stmt.where(*filters)
+
+        return stmt
+
+    # Применение фильтров к UPDATE / DELETE запросу
+    @staticmethod
+    def _filter_statement(stmt: Any, model: Type, *filters: Any, filter_by: Optional[Dict[str, Any]] = None, fetch_many: bool = False) -> Any:
+        """ Функция для применения фильтров к запросу изменения или удаления записей
+
+        Arguments:
+            stmt {Any} -- Запрос update(model) или delete(model)
+            model {Type} -- Модель SqlAlchemy
 
-        return stmt #type: ignore
+        Keyword Arguments:
+            filter_by {Optional[Dict[str, Any]]} -- Фильтрация по полям (default: {None})
+            fetch_many {bool} -- Флаг для изменения одной или всех подходящих записей (default: {False})
+
+        Returns:
+            Any -- Запрос с условиями
+        """
+        
+        if not fetch_many:
+            # Одна запись: ограничиваем запрос подзапросом по первичному ключу с LIMIT 1
+            primary_key = model.__mapper__.primary_key
+            subquery = Client.add_filters(model, *filters, filter_by=filter_by).with_only_columns(*primary_key).limit(1)
+            key = primary_key[0] if len(primary_key) == 1 else tuple_(*primary_key)
+            return stmt.where(key.in_(subquery))
+        
+        if filters:
+            stmt = stmt.where(*filters)
+        if filter_by:
+            stmt = stmt.filter_by(**filter_by)
+        return stmt
 
 
 
@@ -451,13 +632,43 @@ class LogClient(Client):
         """
         
         try:
-            await self.create_table_if_not_exists(model=model)
+            await self.ensure_table(model=model)
             result = await self.insert_model(
                 model=model, 
                 data=[log], 
                 fetch_many=False
                 )
+            if result is None:
+                self._created_tables.discard(model)  # Таблица могла быть удалена - при следующей вставке проверяем заново
             return int(result.id) # type: ignore
         except Exception as e:
-            print(f"Ошибка при вставке лога: {e}")
+            logger.exception("Ошибка при вставке лога: %s", e)
+            return False
+
+    async def insert_logs_bulk(self, model: Type, logs: List[dict], session: Optional[AsyncSession] = None) -> bool:
+        """ Функция для вставки пачки логов в базу данных одним запросом (executemany)
+
+        Arguments:
+            model {Type} -- Модель SqlAlchemy
+            logs {List[dict]} -- Список словарей с данными логов
+
+        Keyword Arguments:
+            session {Optional[AsyncSession]} -- Открытая сессия из Client.session() (commit выполняет вызывающий код) (default: {None})
+
+        Returns:
+            bool -- Статус вставки
+        """
+        
+        try:
+            if not await self.ensure_table(model=model):
+                return False
+            if session is not None:
+                await session.execute(insert(model.__table__), logs)
+                return True
+            async with self.async_session.begin() as session: #type: ignore
+                await session.execute(insert(model.__table__), logs)
+            return True
+        except Exception as e:
+            self._created_tables.discard(model)  # Таблица могла быть удалена - при следующей вставке проверяем заново
+            logger.exception("Ошибка при вставке пачки логов: %s", e)
             return False
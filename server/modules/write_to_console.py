@@ -1,62 +1,79 @@
 from rich.console import Console
 from rich.text import Text
-from datetime import datetime
 from zoneinfo import ZoneInfo
-import re
+from typing import Mapping, Sequence
 
 from server.config.schema import ServerConfig
+from server.rabbitmq.validation import MessageValidate, as_message
 
 class Writer:
     def __init__(self, config: ServerConfig.Console):
         self.config = config
         self.Console = Console()
 
-    async def _render_log(self, message: dict) -> Text:
+    async def reconfigure(self, config: ServerConfig.Console) -> None:
+        """ Функция для применения новых настроек вывода без пересоздания консоли
+
+        Arguments:
+            config {ServerConfig.Console} -- Новые настройки вывода в консоль
+        """
+        
+        self.config = config
+
+    async def _render_log(self, message: MessageValidate) -> Text:
         """ Функция для форматирования сообщения в консоль
 
         Arguments:
-            message {dict} -- JSON сообщение
+            message {MessageValidate} -- Провалидированное сообщение
 
         Returns:
             Text -- Отформатированное сообщение для библиотеки rich
         """
         
-        # Преобразуем строку в datetime, если нужно
-        dt = datetime.fromisoformat(message["timestamp"])
-        dt = dt.astimezone(ZoneInfo(self.config.time_zone))        
+        # Время уже приведено к datetime при валидации сообщения
+        dt = message.timestamp.astimezone(ZoneInfo(self.config.time_zone))        
         ts_str = dt.strftime(self.config.time_format)
         
         data = {
-            "project": Text(message["project"], style=self.config.project_style),
+            "project": Text(message.project, style=self.config.project_style),
             "timestamp": Text(ts_str, style=self.config.timestamp_style),
             "level": Text(
-                message["level"].upper(),
+                message.level.upper(),
                 style=getattr(
                     self.config.level_styles,
-                    message["level"],
+                    message.level,
                     self.config.level_styles.unknown
                 )
             ),
-            "module": Text(message["module"], style=self.config.module_style),
-            "function": Text(message["function"], style=self.config.function_style),
-            "message": Text(message["message"], style=self.config.message_style),
-            "code": Text(str(message["code"]), style=self.config.code_style),
+            "module": Text(message.module, style=self.config.module_style),
+            "function": Text(message.function, style=self.config.function_style),
+            "message": Text(message.message, style=self.config.message_style),
+            "code": Text(str(message.code), style=self.config.code_style),
         }
         
         output = Text()
-        format_str = self.config.format
-        
-        parts = re.split(r"\{(\w+)\}", format_str)
-        for part in parts:
-            if part in data:
-                output.append(data[part])
-            elif part:
-                output.append(part)
+        for literal, field in self.config.format_parts:  # Шаблон разобран заранее при загрузке конфигурации
+            if literal:
+                output.append(literal)
+            if field in data:
+                output.append(data[field])
         
         return output
     
-    async def print_log(self, message: dict) -> None:
-        self.Console.print(await self._render_log(message))
+    async def print_log(self, message: MessageValidate | Mapping) -> None:
+        message = as_message(message)
+        if message is not None:
+            self.Console.print(await self._render_log(message))
+
+    async def print_logs(self, messages: Sequence[MessageValidate]) -> None:
+        """ Функция для вывода пачки сообщений в консоль одним вызовом print
+
+        Arguments:
+            messages {Sequence[MessageValidate]} -- Провалидированные сообщения
+        """
+        
+        if messages:
+            self.Console.print(*[await self._render_log(message) for message in messages], sep="\n")
             
 
             
\ No newline at end of file
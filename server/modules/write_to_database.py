@@ -1,12 +1,51 @@
 # app/server/modules/write_to_database.py
 # Модуль для записи логов в базу данных
 
+import asyncio
+import logging
+from contextlib import suppress
+from typing import Mapping, Sequence
+
 from server.databases.postgres_client import LogClient
 from server.config.schema import ServerConfig
 from server.databases.schema import generate_log_schema
-from datetime import datetime
+from server.rabbitmq.validation import MessageValidate, as_message
+
+logger = logging.getLogger(__name__)
 
 database_models = {}
+_client_cache: dict[tuple, LogClient] = {}  # Клиенты БД по параметрам подключения (переживают перезапуски Consumer)
+
+_QUEUE_SIZE = 10000     # Максимальное количество логов, ожидающих записи в БД
+_BATCH_SIZE = 500       # Максимальное количество логов в одной пачке
+_BATCH_TIMEOUT = 0.05   # Максимальное время добора пачки (в секундах)
+
+
+
+def _client_key(config: ServerConfig.TimescaleDB) -> tuple:
+    """ Функция для получения ключа клиента БД по параметрам подключения
+
+    Arguments:
+        config {ServerConfig.TimescaleDB} -- Настройки подключения к TimescaleDB
+
+    Returns:
+        tuple -- Ключ клиента в кэше
+    """
+    
+    return (config.host, config.port, config.database, config.username, config.password)
+
+
+async def close_idle(active: ServerConfig.TimescaleDB | None = None) -> None:
+    """ Функция для отключения закэшированных клиентов БД, кроме используемого
+
+    Arguments:
+        active {ServerConfig.TimescaleDB | None} -- Настройки активного подключения (None - отключить все)
+    """
+    
+    keep = _client_key(active) if active else None
+    for key in list(_client_cache):
+        if key != keep:
+            await _client_cache.pop(key).disconnect()
 
     
 class Writer:
@@ -14,6 +53,8 @@ class Writer:
         self.config: ServerConfig.TimescaleDB = config
         self.connect = None
         self.client: LogClient
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=_QUEUE_SIZE)  # Логи, ожидающие записи пачкой
+        self._flusher: asyncio.Task | None = None
         
         if not self.connect:
             self._connect()
@@ -21,23 +62,168 @@ class Writer:
     def _connect(self):
         if self.config.enabled:
             
-            self.client = LogClient(self.config)
+            # Клиент с теми же параметрами подключения переиспользуется вместе с его пулом соединений
+            key = _client_key(self.config)
+            client = _client_cache.get(key)
+            if client is None:
+                client = _client_cache[key] = LogClient(self.config)
+            self.client = client
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def reconfigure(self, config: ServerConfig.TimescaleDB) -> None:
+        """ Функция для применения новых настроек без пересоздания клиента
+
+        При тех же параметрах подключения клиент и его пул соединений сохраняются;
+        иначе уже принятые логи дописываются через старый клиент и берётся клиент для новых параметров.
+
+        Arguments:
+            config {ServerConfig.TimescaleDB} -- Новые настройки подключения к TimescaleDB
+        """
+        
+        if _client_key(config) == _client_key(self.config):
+            self.config = config
+            return
+        
+        await self.close()
+        self.config = config
+        self._connect()
             
-    async def write_log(self, log: dict):
+    def _row(self, log: MessageValidate | Mapping, _models=database_models, _gen=generate_log_schema):
+        """ Функция для подготовки лога к записи: модель таблицы проекта и строка
+
+        Arguments:
+            log {MessageValidate | Mapping} -- Лог (словарь предварительно валидируется)
+
+        Returns:
+            tuple | None -- Пара (модель, строка) или None, если лог не прошел валидацию
+        """
         
-        # Проверка на наличие модели БД
-        if log["project"] not in database_models:
-            database_models[log["project"]] = generate_log_schema(log["project"])
+        # Поля читаются как атрибуты модели, словарь предварительно валидируется
+        if not isinstance(log, MessageValidate):
+            log = as_message(log)
+            if log is None:
+                return None
             
-        return await self.client.insert_log(
-            model=database_models[log["project"]],
-            log={
-                "level": log["level"],
-                "timestamp": datetime.fromisoformat(log["timestamp"]),
-                "module": log["module"],
-                "function": log["function"],
-                "message": log["message"],
-                "code": log["code"]
-            }
-        )
-        
\ No newline at end of file
+        # Проверка на наличие модели БД (одна выборка из словаря, глобальные имена связаны заранее)
+        project = log.project
+        model = _models.get(project)
+        if model is None:
+            model = _models[project] = _gen(project)
+            
+        return model, {
+            "level": log.level,
+            "timestamp": log.timestamp,  # Уже datetime после валидации сообщения
+            "module": log.module,
+            "function": log.function,
+            "message": log.message,
+            "code": log.code
+        }
+
+    async def write_log(self, log: MessageValidate | Mapping):
+        
+        # Лог ставится в очередь, запись в БД выполняет фоновая задача пачками
+        item = self._row(log)
+        if item is not None:
+            await self._queue.put(item)
+
+    async def write_logs(self, logs: Sequence[MessageValidate]) -> bool:
+        """ Функция для записи пачки логов в БД с ожиданием фиксации транзакции
+
+        Arguments:
+            logs {Sequence[MessageValidate]} -- Провалидированные сообщения
+
+        Returns:
+            bool -- Результат записи (True - все логи записаны в БД)
+        """
+        
+        # Пачка пишется сразу, минуя очередь: вызывающий подтверждает сообщения только после фиксации
+        batch = [item for item in map(self._row, logs) if item is not None]
+        if not batch:
+            return True
+        return await self._flush(batch)
+
+    async def _flush_loop(self):
+        """ Фоновая задача для записи логов в БД пачками
+
+        Набирает до _BATCH_SIZE логов (или ждёт не дольше _BATCH_TIMEOUT секунд)
+        и записывает их одним запросом на каждую таблицу проекта. Завершается, получив None из очереди.
+        """
+        
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        running = True
+        while running:
+            item = await queue.get()
+            if item is None:
+                break
+            batch = [item]
+            deadline = loop.time() + _BATCH_TIMEOUT
+            while len(batch) < _BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    running = False
+                    break
+                batch.append(item)
+            await self._flush(batch)
+
+    async def _flush(self, batch: list) -> bool:
+        """ Функция для записи пачки логов, сгруппированных по таблицам проектов
+
+        Arguments:
+            batch {list} -- Список пар (модель, лог)
+
+        Returns:
+            bool -- Результат записи (True - все таблицы записаны)
+        """
+        
+        groups = {}
+        for model, row in batch:
+            groups.setdefault(model, []).append(row)
+        
+        # Одна сессия и одна фиксация транзакции на всю пачку (по запросу на каждую таблицу)
+        try:
+            async with self.client.session() as session:
+                for model, rows in groups.items():
+                    if not await self.client.insert_logs_bulk(model=model, logs=rows, session=session):
+                        break
+                else:
+                    await session.commit()
+                    return True
+                await session.rollback()
+        except Exception as e:
+            logger.exception("Ошибка при записи пачки логов в БД (%s записей), повтор по таблицам: %s", len(batch), e)
+        
+        # Ошибка в одной таблице не должна отменять запись остальных: повторяем по таблицам в отдельных транзакциях
+        result = True
+        for model, rows in groups.items():
+            if not await self.client.insert_logs_bulk(model=model, logs=rows):
+                result = False
+        return result
+
+    async def close(self):
+        """ Функция для остановки фоновой записи с дозаписью оставшихся логов
+        """
+        
+        # Фоновая задача не отменяется: пачка, которую она уже записывает, должна дойти до БД.
+        # Сигнал остановки встаёт в очередь после принятых логов, и задача дописывает их сама
+        if self._flusher:
+            if not self._flusher.done():
+                await self._queue.put(None)
+            with suppress(Exception):
+                await self._flusher
+            self._flusher = None
+
+        # Остаток (если задача завершилась раньше или логи пришли после сигнала остановки)
+        batch = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not None:
+                batch.append(item)
+        if batch:
+            await self._flush(batch)
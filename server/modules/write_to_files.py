@@ -14,11 +14,12 @@ import lzma
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, Mapping, Sequence
 import io
 from pydantic import BaseModel
 
 from server.config.schema import ServerConfig
+from server.rabbitmq.validation import MessageValidate, as_message
 
 class FileData(BaseModel):
     path: Optional[Path] = None
@@ -45,6 +46,31 @@ class Writer:
         self._log_dir: Dict[str, Path] = {}
         self._archive_dir: Dict[str, Path] = {}
 
+    async def reconfigure(self, config: ServerConfig.Files) -> bool:
+        """ Функция для применения новых настроек без пересоздания клиента
+
+        Открытые файлы закрываются, только если изменилось их расположение (директории или имя файла);
+        формат строк, ротация и архивация применяются к уже открытым файлам.
+
+        Arguments:
+            config {ServerConfig.Files} -- Новые настройки записи в файлы
+
+        Returns:
+            bool -- Статус применения настроек
+        """
+        
+        old, self.cfg = self.cfg, config
+        if (old.shared_directory, old.project_directory, old.filename, old.date_file_format, old.archive.directory) == \
+                (config.shared_directory, config.project_directory, config.filename, config.date_file_format, config.archive.directory):
+            return True
+        
+        status = await self.close_all()
+        self._active_file_data.clear()
+        self._active_file_handle.clear()
+        self._log_dir.clear()
+        self._archive_dir.clear()
+        return status
+
     def get_info(self) -> ServerConfig.Files:
         return self.cfg
         
@@ -187,46 +213,79 @@ class Writer:
             print(f"Ошибка открытия файла: {e}")
             return False
 
-    async def write_log(self, log_data: dict) -> bool:
+    async def _write_line(self, log_data: MessageValidate) -> str:
+        """ Функция для записи строки лога в файл проекта (без сброса буфера на диск)
+
+        Arguments:
+            log_data {MessageValidate} -- Провалидированное сообщение с данными лога
+
+        Returns:
+            str -- Имя проекта, в файл которого записан лог
+        """
+        
+        # Получем от какого проекта пришел запрос
+        project = log_data.project
+        
+        # Проверяем что объект проекта уже хранится в кэше
+        if project not in self._active_file_handle:
+            self._active_file_data[project] = FileData()
+            await self._create_directory(project)
+            await self._open_new_file(project)
+            
+        # Проверяем на смену файла
+        if self._should_rotate(project):
+            await self._open_new_file(project)
+            
+        # Форматируем строку лога
+        formatted_log = self.cfg.format_log(
+            project=project,
+            timestamp=log_data.timestamp.isoformat(),  # Как и раньше, время сообщения пишется в ISO формате
+            level=log_data.level.upper(),
+            module=log_data.module,
+            function=log_data.function,
+            message=log_data.message,
+            code=log_data.code
+        )
+        
+        if self._active_file_handle[project]:
+            self._active_file_handle[project].write(formatted_log + "\n")
+            self._active_file_data[project].count_lines += 1
+        
+        return project
+
+    async def write_log(self, log_data: MessageValidate | Mapping) -> bool:
         """ Функция для записи лога в файл
 
         Arguments:
-            log_data {dict} -- Словарь с данными лога
+            log_data {MessageValidate | Mapping} -- Провалидированное сообщение (или словарь) с данными лога
 
         Returns:
             bool -- Статус записи лога
         """
         
+        log_data = as_message(log_data)
+        if log_data is None:
+            return False
+        return await self.write_logs((log_data,))
+
+    async def write_logs(self, logs: Sequence[MessageValidate]) -> bool:
+        """ Функция для записи пачки логов в файлы (буфер каждого файла сбрасывается один раз на пачку)
+
+        Arguments:
+            logs {Sequence[MessageValidate]} -- Провалидированные сообщения с данными логов
+
+        Returns:
+            bool -- Статус записи логов
+        """
+        
         try:
-            # Получем от какого проекта пришел запрос
-            project = log_data.get("project", "unknown")
-            
-            # Проверяем что объект проекта уже хранится в кэше
-            if project not in self._active_file_handle:
-                self._active_file_data[project] = FileData()
-                await self._create_directory(project)
-                await self._open_new_file(project)
-                
-            # Проверяем на смену файла
-            if self._should_rotate(project):
-                await self._open_new_file(project)
+            projects = set()
+            for log_data in logs:
+                projects.add(await self._write_line(log_data))
                 
-
-            # Форматируем строку лога
-            formatted_log = self.cfg.log_format.format(
-                project=project,
-                timestamp=log_data.get("timestamp", datetime.now().strftime(self.cfg.date_log_format)),
-                level=log_data.get("level", "unknown").upper(),
-                module=log_data.get("module", "unknown"),
-                function=log_data.get("function", "unknown"),
-                message=log_data.get("message", ""),
-                code=log_data.get("code", 0)
-            )
-            
-            if self._active_file_handle[project]:
-                self._active_file_handle[project].write(formatted_log + "\n")
-                self._active_file_handle[project].flush()
-                self._active_file_data[project].count_lines += 1
+            for project in projects:
+                if self._active_file_handle.get(project):
+                    self._active_file_handle[project].flush()
             
             return True
         except Exception as e:
@@ -2,14 +2,19 @@
 # Модуль для получения данных из очереди RabbitMQ и перенаправления их в дочерние модули
 
 import asyncio
-import json
 import logging
 import aio_pika
 from typing import Optional
 from contextlib import suppress
 
-from server.rabbitmq.validation import validate_message
-from server.modules.write_to_database import Writer as DatabaseWriter
+try:
+    # Быстрый разбор JSON прямо из байтов
+    from orjson import loads as json_loads, JSONDecodeError
+except ImportError:
+    from json import loads as json_loads, JSONDecodeError
+
+from server.rabbitmq.validation import decode_message
+from server.modules.write_to_database import Writer as DatabaseWriter, close_idle as close_idle_database_clients
 from server.modules.write_to_console import Writer as ConsoleWriter
 from server.modules.write_to_files import Writer as FilesWriter
 from server.config.schema import ServerConfig
@@ -23,25 +28,49 @@ from server.rabbitmq.errors import ExceptionRabbitMQ as Exc
 setup_logging()
 logger = logging.getLogger(__name__)
 
+_SERVICE_QUEUE = "service_queue"  # Имя сервисной очереди (сигналы обновления конфигурации)
+_QUEUE_TTL = 30000             # Время жизни сообщений в очередях (в миллисекундах)
+_CONFIG_UPDATE_TYPE = "config_update"  # Тип (свойство AMQP type) сообщения об обновлении конфигурации
+_SERVICE_PREFETCH_COUNT = 10   # Предвыборка для сервисной очереди (редкие сигналы обновления конфигурации)
+_BATCH_SIZE = 100              # Максимальное количество сообщений в одной пачке записи
+_BATCH_TIMEOUT = 0.05          # Максимальное время добора пачки (в секундах)
+
 class RabbitMQConsumer:
     def __init__(self):
         """ Функция для инициализации модуля
+
+        Состояние модуля (соединение, каналы, флаги) изменяется только из задач одного event loop,
+        поэтому блокировки для него не используются.
         """
         # self.config: ServerConfig = cfg.config  # Теперь получаем из config_manager
         self.config: ServerConfig = cfg.config # Используем глобальный config_manager
         self.connection: Optional[aio_pika.RobustConnection] = None             # Соединение с RabbitMQ
-        self.channel: Optional[aio_pika.RobustChannel] = None                   # Канал для работы с RabbitMQ
-        self.queue: Optional[aio_pika.RobustQueue] = None                       # Очередь для получения сообщений
+        self.channels: list[aio_pika.RobustChannel] = []                       # Каналы получателей очереди логов
+        self.service_channel: Optional[aio_pika.RobustChannel] = None           # Отдельный канал для сервисных сообщений
+        self.queues: list[aio_pika.RobustQueue] = []                           # Очередь логов, объявленная на каждом из каналов
         self.service_queue: Optional[aio_pika.RobustQueue] = None               # Очередь для получения сообщений (сервисных)
-        self.consumer_tag: Optional[str] = None                                 # Тег для получения сообщений
+        self.consumer_tags: list[str] = []                                      # Теги получателей очереди логов
         self.service_tag: Optional[str] = None                                  # Тег для получения сообщений (сервисных)
         self._running = False                                                   # Статус работы модуля
         self._restart_requested = False                                         # Статус необходимости перезапуска модуля
-        self._lock = asyncio.Lock()                                             # Блокировка для thread-safe операций
+        self._pending: asyncio.Queue = asyncio.Queue()                          # Провалидированные сообщения, ожидающие записи пачкой
+        self._batcher_task: Optional[asyncio.Task] = None                       # Фоновая задача пакетной записи
+        self._stop_event = asyncio.Event()                                      # Сигнал для основного цикла run_forever (перезапуск или остановка)
+        self.started = asyncio.Event()                                          # Модуль запущен и получает сообщения
 
         self._console_client: Optional[ConsoleWriter] = None                    # Клиент для вывода логов в консоль
         self._database_client: Optional[DatabaseWriter] = None                  # Клиент для сохранения логов в БД
         self._files_client: Optional[FilesWriter] = None                        # Клиент для сохранения логов в файлы
+        self._handle = None                                                     # Обработчик обычных сообщений (собирается в _init_clients)
+        self._flush = None                                                      # Запись пачки во все приёмники (собирается в _init_clients)
+        self._amqp_url: str = ""                                                # URL подключения к RabbitMQ (обновляется в _build_connection_params)
+        self._broker: str = ""                                                  # Адрес RabbitMQ для сообщений в логе (обновляется в _build_connection_params)
+        self._queue_name: str = ""                                              # Имя очереди логов (обновляется в _build_connection_params)
+        self._service_queue_name: str = _SERVICE_QUEUE                          # Имя сервисной очереди
+        self._queue_args: dict = {}                                             # Аргументы объявления очередей (обновляется в _build_connection_params)
+        self._prefetch_count: int = 0                                           # Предвыборка очереди логов (обновляется в _build_connection_params)
+        self._consumers: int = 1                                                # Количество получателей очереди логов (обновляется в _build_connection_params)
+        self._connect_kwargs: dict = {}                                         # Параметры соединения для connect_robust (обновляется в _build_connection_params)
 
     def _log_and_raise(self, exc_class, message: str, original_exc: Exception):
         """
@@ -61,42 +90,68 @@ class RabbitMQConsumer:
             logger.error(log_message)
             raise exc_class(message)
 
-    async def _init_clients(self) -> None:
+    async def _init_clients(self, previous: Optional[ServerConfig] = None) -> None:
         """
         Инициализирует клиентов для записи логов.
+        Если передана предыдущая конфигурация, обновляются только клиенты, чей раздел конфигурации изменился
+        (существующие клиенты перенастраиваются через reconfigure, а не создаются заново).
         Бросает ModuleError при ошибках.
         """
         try:
             logger.debug("Инициализация клиентов...")
-            # Закрываем старые клиенты (если они есть)
-            if self._files_client:
-                try:
-                    await self._files_client.close_all()
-                    logger.debug("Старый FilesClient закрыт.")
-                except Exception as e:
-                    logger.warning(f"Предупреждение при закрытии старого FilesClient: {e}")
-
-            # Создаём новые клиенты на основе текущей конфигурации
-            if self.config.console.enabled:
-                logger.debug("Создание ConsoleClient...")
-                self._console_client = ConsoleWriter(self.config.console)
-            else:
-                logger.debug("Консоль отключена, ConsoleClient не создаётся.")
-                self._console_client = None
 
-            if self.config.timescaledb.enabled:
-                logger.debug("Создание DatabaseClient...")
-                self._database_client = DatabaseWriter(self.config.timescaledb)
-            else:
-                logger.debug("TimescaleDB отключена, DatabaseClient не создаётся.")
-                self._database_client = None
+            if previous is None or previous.console != self.config.console:
+                if self.config.console.enabled and self._console_client:
+                    logger.debug("Обновление настроек ConsoleClient...")
+                    await self._console_client.reconfigure(self.config.console)
+                elif self.config.console.enabled:
+                    logger.debug("Создание ConsoleClient...")
+                    self._console_client = ConsoleWriter(self.config.console)
+                else:
+                    logger.debug("Консоль отключена, ConsoleClient не создаётся.")
+                    self._console_client = None
 
-            if self.config.files.enabled:
-                logger.debug("Создание FilesClient...")
-                self._files_client = FilesWriter(self.config.files)
-            else:
-                logger.debug("Файловый вывод отключён, FilesClient не создаётся.")
-                self._files_client = None
+            if previous is None or previous.timescaledb != self.config.timescaledb:
+                if self.config.timescaledb.enabled and self._database_client:
+                    # Клиент переиспользуется: пул соединений пересоздаётся только при смене параметров подключения
+                    logger.debug("Обновление настроек DatabaseClient...")
+                    await self._database_client.reconfigure(self.config.timescaledb)
+                elif self.config.timescaledb.enabled:
+                    logger.debug("Создание DatabaseClient...")
+                    self._database_client = DatabaseWriter(self.config.timescaledb)
+                else:
+                    logger.debug("TimescaleDB отключена, DatabaseClient не создаётся.")
+                    if self._database_client:
+                        try:
+                            await self._database_client.close()
+                            logger.debug("Старый DatabaseClient закрыт.")
+                        except Exception as e:
+                            logger.warning("Предупреждение при закрытии старого DatabaseClient: %s", e)
+                    self._database_client = None
+
+            if previous is None or previous.files != self.config.files:
+                if self.config.files.enabled and self._files_client:
+                    # Открытые файлы сохраняются, если их расположение не изменилось
+                    logger.debug("Обновление настроек FilesClient...")
+                    await self._files_client.reconfigure(self.config.files)
+                elif self.config.files.enabled:
+                    logger.debug("Создание FilesClient...")
+                    self._files_client = FilesWriter(self.config.files)
+                else:
+                    logger.debug("Файловый вывод отключён, FilesClient не создаётся.")
+                    if self._files_client:
+                        try:
+                            await self._files_client.close_all()
+                            logger.debug("Старый FilesClient закрыт.")
+                        except Exception as e:
+                            logger.warning("Предупреждение при закрытии старого FilesClient: %s", e)
+                    self._files_client = None
+
+            # Отключаем клиентов БД, параметры подключения которых больше не используются
+            await close_idle_database_clients(self.config.timescaledb if self._database_client else None)
+
+            # Обработчик сообщений пересобирается под текущий набор приёмников
+            self._handle, self._flush = self._make_handler()
 
             logger.debug("Клиенты инициализированы успешно.")
 
@@ -107,64 +162,186 @@ class RabbitMQConsumer:
                 e
             )
 
-    async def _distribution_message(self, message: aio_pika.IncomingMessage) -> None:
+    def _build_connection_params(self) -> None:
+        """ Функция для расчёта параметров подключения к RabbitMQ из текущей конфигурации
+
+        Вызывается при запуске (и перезапуске) модуля, чтобы при переподключениях
+        _connect не собирал URL и аргументы очередей заново.
         """
-        Логика обработки обычного сообщения.
+        
+        rmq = self.config.rabbitmq
+        # heartbeat передаётся параметром URL: именно оттуда его читает aiormq
+        self._amqp_url = f"amqp://{rmq.username}:{rmq.password}@{rmq.host}:{rmq.port}/?heartbeat={rmq.heartbeat}"
+        self._broker = f"{rmq.host}:{rmq.port}"
+        self._queue_name = rmq.queue
+        self._service_queue_name = _SERVICE_QUEUE
+        self._queue_args = {"x-message-ttl": _QUEUE_TTL}
+        self._consumers = rmq.consumers
+        self._prefetch_count = max(1, rmq.prefetch_count // rmq.consumers)  # Общая предвыборка делится между получателями
+        self._connect_kwargs = {"timeout": rmq.connect_timeout}
+
+    def _make_handler(self):
+        """ Функция для сборки обработчика обычных сообщений и записи пачек под текущий набор приёмников
+
+        Приёмники, декодер и очередь захватываются в замыкания как локальные переменные,
+        поэтому на каждое сообщение не выполняются проверки флагов и поиск атрибутов self.
+        Сообщения подтверждаются вручную: одним ack(multiple=True) на пачку после её записи.
+
+        Returns:
+            tuple -- Обработчик для queue.consume и функция записи пачки во все приёмники
         """
-        async with message.process():
+        
+        sinks = []
+        if self._database_client:
+            sinks.append((self._database_client.write_logs, "Ошибка записи в БД"))
+        if self._console_client:
+            sinks.append((self._console_client.print_logs, "Ошибка вывода в консоль"))
+        if self._files_client:
+            sinks.append((self._files_client.write_logs, "Ошибка записи в файл"))
+        sinks = tuple(sinks)
+        decode = decode_message
+        gather = asyncio.gather
+        put = self._pending.put_nowait
+
+        async def handler(message: aio_pika.IncomingMessage) -> None:
+            body = message.body
             try:
-                dict_message: dict = json.loads(message.body.decode())
-                result_validation = await validate_message(dict_message)
-                if not result_validation:
-                    logger.warning("Некорректные данные в сообщении, пропускаем.")
-                    return
+                log = decode(body)  # Разбор и валидация JSON за один проход в типизированную модель
+            except Exception as e:
+                logger.exception("Неожиданная ошибка при обработке обычного сообщения: %s", e)
+                log = None
+            if log is None:
+                logger.warning("Некорректные данные в сообщении, пропускаем. Тело: %s", body[:100].decode("utf-8", errors="replace"))
+
+            # Все доставки проходят через очередь в порядке получения (некорректные - без лога),
+            # чтобы одно накопительное подтверждение пачки покрывало их все
+            put((log, message))
+
+        async def requeue(last) -> None:
+            # Возвращаем все сообщения пачки в очередь одним кадром на канал
+            for message in last:
+                with suppress(Exception):
+                    await message.nack(multiple=True, requeue=True)
 
-                # Запись в БД
-                if self.config.timescaledb.enabled and self._database_client:
-                    try:
-                        await self._database_client.write_log(log=dict_message)
-                    except Exception as e:
-                        logger.error(f"Ошибка записи в БД: {e}")
+        async def flush(batch: list) -> None:
+            logs = [log for log, _ in batch if log is not None]
+            # Подтверждения действуют в пределах канала: берём последнее сообщение пачки от каждого канала
+            last = {message.channel: message for _, message in batch}.values()
+            failed = False
+            try:
+                if logs:
+                    # Пачка пишется во все включённые приёмники одновременно; запись в БД
+                    # завершается только после фиксации транзакции
+                    results = await gather(*[write(logs) for write, _ in sinks], return_exceptions=True)
+                    for (_, error), result in zip(sinks, results):
+                        if isinstance(result, BaseException):
+                            logger.error("%s: %s", error, result)
+                            failed = True
+                        elif result is False:
+                            logger.error("%s: пачка из %s сообщений не записана", error, len(logs))
+                            failed = True
+            except BaseException:
+                await requeue(last)
+                raise
+            if failed:
+                # Доставка не менее одного раза: при сбое любого приёмника пачка возвращается в очередь
+                # (повторная доставка может задублировать логи в приёмниках, записавших её успешно)
+                await requeue(last)
+                return
+            # Одно подтверждение с multiple=True на канал для всех сообщений пачки
+            try:
+                for message in last:
+                    await message.ack(multiple=True)
+            except Exception as e:
+                logger.error("Ошибка подтверждения пачки сообщений: %s", e)
 
-                # Запись в консоль
-                if self.config.console.enabled and self._console_client:
-                    try:
-                        await self._console_client.print_log(dict_message)
-                    except Exception as e:
-                        logger.error(f"Ошибка вывода в консоль: {e}")
+        return handler, flush
 
-                # Запись в файлы
-                if self.config.files.enabled and self._files_client:
-                    try:
-                        await self._files_client.write_log(dict_message)
-                    except Exception as e:
-                        logger.error(f"Ошибка записи в файл: {e}")
+    async def _batch_loop(self) -> None:
+        """ Фоновая задача для записи сообщений пачками
 
-            except json.JSONDecodeError as e:
-                logger.error(f"Ошибка декодирования JSON в сообщении: {e}. Тело: {message.body.decode()[:100]}...")
-            except Exception as e:
-                logger.error(f"Неожиданная ошибка при обработке обычного сообщения: {e}", exc_info=True)
+        Набирает до _BATCH_SIZE сообщений (или ждёт не дольше _BATCH_TIMEOUT секунд)
+        и записывает их во все приёмники. Завершается, получив None из очереди.
+        """
+        
+        loop = asyncio.get_running_loop()
+        pending = self._pending
+        running = True
+        while running:
+            item = await pending.get()
+            if item is None:
+                break
+            batch = [item]
+            deadline = loop.time() + _BATCH_TIMEOUT
+            while len(batch) < _BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(pending.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    running = False
+                    break
+                batch.append(item)
+            await self._flush(batch)
+
+    async def _stop_batcher(self) -> None:
+        """ Функция для остановки пакетной записи с дозаписью уже принятых сообщений
+        """
+        
+        if self._batcher_task:
+            self._pending.put_nowait(None)
+            with suppress(Exception):
+                await self._batcher_task
+            self._batcher_task = None
 
     async def _distribution_service_message(self, message: aio_pika.IncomingMessage) -> None:
         """
         Логика обработки сервисного сообщения.
         """
+        body = message.body
         async with message.process():
+            # Сигнал от API распознаётся по типу сообщения, без разбора JSON
+            if message.type == _CONFIG_UPDATE_TYPE:
+                logger.info("Получен сигнал обновления конфигурации. Запрашиваем перезапуск...")
+                self._restart_requested = True
+                self._stop_event.set()
+                return
+
+            # Сообщения без типа разбираются, только если похожи на сигнал обновления
+            if b"Update config" not in body and b'"code":100' not in body.replace(b" ", b""):
+                return
+
             try:
-                dict_message: dict = json.loads(message.body.decode())
+                dict_message: dict = json_loads(body)
                 # Проверяем на сигнал обновления конфигурации
                 if dict_message.get("code") == 100 or dict_message.get("detail") == "Update config":
                     logger.info("Получен сигнал обновления конфигурации. Запрашиваем перезапуск...")
                     self._restart_requested = True
-                    # Прерываем основной цикл run_forever
-                    self._running = False
-                    # Опционально: можно вызвать asyncio.current_task().cancel() или установить asyncio.Event
-                    # для более быстрого реагирования, но простой флаг _running уже работает.
+                    # Будим основной цикл run_forever (без периодического опроса флага)
+                    self._stop_event.set()
 
-            except json.JSONDecodeError as e:
-                logger.error(f"Ошибка декодирования JSON в сервисном сообщении: {e}. Тело: {message.body.decode()[:100]}...")
+            except JSONDecodeError as e:
+                logger.error("Ошибка декодирования JSON в сервисном сообщении: %s. Тело: %s", e, body[:100].decode("utf-8", errors="replace"))
             except Exception as e:
-                logger.error(f"Неожиданная ошибка при обработке сервисного сообщения: {e}", exc_info=True)
+                logger.exception("Неожиданная ошибка при обработке сервисного сообщения: %s", e)
+
+    async def _consume_logs(self) -> None:
+        """ Функция для подписки обработчика на очередь логов на каждом из каналов
+        """
+        
+        self.consumer_tags = [await queue.consume(self._handle) for queue in self.queues] # type: ignore
+
+    async def _cancel_logs(self) -> None:
+        """ Функция для отмены всех подписок на очередь логов
+        """
+        
+        for queue, tag in zip(self.queues, self.consumer_tags):
+            with suppress(Exception): # Игнорируем ошибки при отмене (например, если соединение уже разорвано)
+                await queue.cancel(tag)
+        self.consumer_tags = []
 
     async def _connect(self) -> None:
         """
@@ -173,32 +350,39 @@ class RabbitMQConsumer:
         """
         try:
             logger.debug("Подключение к RabbitMQ...")
-            config = self.config.rabbitmq
-            url = f"amqp://{config.username}:{config.password}@{config.host}:{config.port}/"
-
-            self.connection = await aio_pika.connect_robust(url) # type: ignore
-            self.channel = await self.connection.channel() # type: ignore
-            self.queue = await self.channel.declare_queue( # type: ignore
-                config.queue,
+            self.connection = await aio_pika.connect_robust(self._amqp_url, **self._connect_kwargs) # type: ignore
+            # Каналы только получают сообщения, поэтому подтверждения публикации на них не включаются
+            # Очередь логов читают несколько получателей, каждый на своём канале со своей предвыборкой
+            self.channels, self.queues = [], []
+            for _ in range(self._consumers):
+                channel = await self.connection.channel(publisher_confirms=False) # type: ignore
+                await channel.set_qos(prefetch_count=self._prefetch_count) # type: ignore
+                self.channels.append(channel)
+                self.queues.append(await channel.declare_queue( # type: ignore
+                    self._queue_name,
+                    durable=True,
+                    auto_delete=False,
+                    arguments=self._queue_args
+                ))
+
+            # Сервисные сообщения получаем по отдельному каналу, чтобы они не ждали очереди за логами
+            self.service_channel = await self.connection.channel(publisher_confirms=False) # type: ignore
+            await self.service_channel.set_qos(prefetch_count=_SERVICE_PREFETCH_COUNT) # type: ignore
+            self.service_queue = await self.service_channel.declare_queue( # type: ignore
+                self._service_queue_name,
                 durable=True,
                 auto_delete=False,
-                arguments={"x-message-ttl": 30000}
-            )
-            self.service_queue = await self.channel.declare_queue( # type: ignore
-                "service_queue", # Возможно, лучше вынести в конфиг
-                durable=True,
-                auto_delete=False,
-                arguments={"x-message-ttl": 30000}
+                arguments=self._queue_args
             )
 
-            self.consumer_tag = await self.queue.consume(self._distribution_message) # type: ignore
+            await self._consume_logs()
             self.service_tag = await self.service_queue.consume(self._distribution_service_message) # type: ignore
-            logger.info(f"Успешно подключено к RabbitMQ: {config.host}:{config.port}, queues: {config.queue}, service_queue")
+            logger.info("Успешно подключено к RabbitMQ: %s, queues: %s (получателей: %s), %s", self._broker, self._queue_name, self._consumers, self._service_queue_name)
 
         except (aio_pika.exceptions.AMQPConnectionError, OSError) as e: # Ловим конкретные ошибки подключения
             self._log_and_raise(
                 Exc.ConnectionError,
-                f"Ошибка подключения к RabbitMQ {self.config.rabbitmq.host}:{self.config.rabbitmq.port} - {e}",
+                f"Ошибка подключения к RabbitMQ {self._broker} - {e}",
                 e
             )
         except Exception as e: # Ловим любые другие ошибки при подключении
@@ -216,13 +400,17 @@ class RabbitMQConsumer:
         try:
             logger.info("Запуск Consumer...")
             await self._init_clients()
+            self._build_connection_params()
+            self._batcher_task = asyncio.create_task(self._batch_loop())
             await self._connect()
             self._running = True
             self._restart_requested = False
+            self._stop_event.clear()
+            self.started.set()
             logger.info("Consumer запущен успешно.")
 
         except (Exc.ModuleError, Exc.ConnectionError) as e: # Пробрасываем наши специфичные ошибки
-            logger.error(f"Критическая ошибка при запуске Consumer: {e}")
+            logger.error("Критическая ошибка при запуске Consumer: %s", e)
             self._running = False
             raise # Пробрасываем дальше
         except Exception as e: # Ловим любые другие ошибки
@@ -232,6 +420,30 @@ class RabbitMQConsumer:
                 e
             )
 
+    async def _reconfigure(self, previous: ServerConfig) -> None:
+        """ Функция для применения новой конфигурации без переподключения к RabbitMQ
+
+        Пересоздаёт только клиенты записи, чей раздел конфигурации изменился; соединение,
+        каналы и сервисная подписка сохраняются.
+
+        Arguments:
+            previous {ServerConfig} -- Конфигурация, с которой работал модуль до обновления
+        """
+        
+        if (previous.console, previous.timescaledb, previous.files) != (self.config.console, self.config.timescaledb, self.config.files):
+            # Останавливаем приём логов и дописываем уже принятые старыми клиентами
+            await self._cancel_logs()
+            await self._stop_batcher()
+
+            await self._init_clients(previous)
+            self._batcher_task = asyncio.create_task(self._batch_loop())
+            await self._consume_logs()
+        else:
+            logger.debug("Разделы клиентов записи не изменились, пересоздание не требуется.")
+
+        self._restart_requested = False
+        self._stop_event.clear()
+
     async def stop(self) -> None:
         """
         Останавливает модуль: отменяет подписки, закрывает каналы и соединения.
@@ -239,11 +451,9 @@ class RabbitMQConsumer:
         """
         logger.info("Остановка Consumer...")
         try:
-            if self.consumer_tag and self.queue:
-                logger.debug("Отмена подписки на основную очередь...")
-                with suppress(Exception): # Игнорируем ошибки при отмене (например, если соединение уже разорвано)
-                    await self.queue.cancel(self.consumer_tag)
-                self.consumer_tag = None
+            if self.consumer_tags:
+                logger.debug("Отмена подписок на основную очередь...")
+                await self._cancel_logs()
 
             if self.service_tag and self.service_queue:
                 logger.debug("Отмена подписки на сервисную очередь...")
@@ -251,11 +461,21 @@ class RabbitMQConsumer:
                     await self.service_queue.cancel(self.service_tag)
                 self.service_tag = None
 
-            if self.channel:
-                logger.debug("Закрытие канала...")
+            # Дописываем уже принятые сообщения до закрытия канала, чтобы их подтверждения дошли до брокера
+            await self._stop_batcher()
+
+            if self.service_channel:
+                logger.debug("Закрытие сервисного канала...")
                 with suppress(Exception):
-                    await self.channel.close()
-                self.channel = None
+                    await self.service_channel.close()
+                self.service_channel = None
+
+            if self.channels:
+                logger.debug("Закрытие каналов...")
+                for channel in self.channels:
+                    with suppress(Exception):
+                        await channel.close()
+                self.channels, self.queues = [], []
 
             if self.connection:
                 logger.debug("Закрытие соединения...")
@@ -269,21 +489,36 @@ class RabbitMQConsumer:
                     await self._files_client.close_all()
                 self._files_client = None
 
+            if self._database_client:
+                logger.debug("Закрытие DatabaseClient (дозапись оставшихся логов)...")
+                with suppress(Exception):
+                    await self._database_client.close()
+                self._database_client = None
+
+            # При полной остановке (не перезапуске) закрываем и пул соединений с БД
+            if not self._restart_requested:
+                with suppress(Exception):
+                    await close_idle_database_clients()
+
+            self._handle = self._flush = None
             self._running = False
+            self.started.clear()
+            self._stop_event.set()
             logger.info("Consumer остановлен.")
 
         except Exception as e:
-            logger.error(f"Ошибка при остановке Consumer: {e}", exc_info=True) # Логгируем traceback
+            logger.error("Ошибка при остановке Consumer: %s", e, exc_info=True) # Логгируем traceback
             # Не поднимаем исключение, так как цель - остановка, а не ошибка
 
     async def restart(self) -> None:
         """
-        Перезапускает модуль: останавливает, обновляет конфигурацию, запускает.
+        Перезапускает модуль: обновляет конфигурацию и применяет только изменившиеся разделы.
+        Соединение с RabbitMQ пересоздаётся (stop + start), только если изменились его параметры.
         Бросает ConfigUpdateError, StartError, StopError при ошибках.
         """
         try:
             logger.info("Начало перезапуска Consumer...")
-            await self.stop()
+            previous = self.config
 
             # Обновляем конфигурацию из config_manager
             logger.debug("Обновление конфигурации из config_manager...")
@@ -297,11 +532,16 @@ class RabbitMQConsumer:
                     e
                 )
 
-            await self.start()
+            if self.connection and self.queues and previous.rabbitmq == self.config.rabbitmq:
+                await self._reconfigure(previous)
+                self._running = True
+            else:
+                await self.stop()
+                await self.start()
             logger.info("Consumer успешно перезапущен.")
 
         except (Exc.StartError, Exc.StopError, Exc.ConfigUpdateError) as e: # Пробрасываем наши специфичные ошибки
-            logger.error(f"Ошибка при перезапуске Consumer: {e}")
+            logger.error("Ошибка при перезапуске Consumer: %s", e)
             raise # Пробрасываем дальше
         except Exception as e: # Ловим любые другие ошибки
             self._log_and_raise(
@@ -321,9 +561,9 @@ class RabbitMQConsumer:
             while True:
                 # Основной цикл работы
                 if self._running:
-                    logger.info(f"Consumer запущен и слушает {self.config.rabbitmq.host}:{self.config.rabbitmq.port}")
-                    while self._running:
-                        await asyncio.sleep(1)
+                    logger.info("Consumer запущен и слушает %s", self._broker)
+                    await self._stop_event.wait()  # Ожидаем сигнал вместо опроса раз в секунду
+                    self._stop_event.clear()
 
                 # Проверка на требование перезапуска
                 if self._restart_requested:
@@ -337,7 +577,7 @@ class RabbitMQConsumer:
         except asyncio.CancelledError:
             logger.info("Задача Consumer отменена.")
         except (Exc.StartError, Exc.StopError, Exc.ConfigUpdateError) as e:
-            logger.error(f"Критическая ошибка в run_forever, завершение: {e}")
+            logger.error("Критическая ошибка в run_forever, завершение: %s", e)
             # Пробрасываем ошибку дальше, если вызывающий код готов её обработать
             raise
         except Exception as e:
@@ -356,11 +596,18 @@ class RabbitMQConsumer:
 if __name__ == "__main__":
     consumer = RabbitMQConsumer()
     
+    # Event loop на libuv (uvloop), если он установлен; иначе стандартный asyncio
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         asyncio.run(consumer.run_forever())
     except (Exc.StartError, Exc.StopError, Exc.ConfigUpdateError, Exc.ModuleError) as e:
-        logger.critical(f"Критическая ошибка в Consumer, работа завершена: {e}")
+        logger.critical("Критическая ошибка в Consumer, работа завершена: %s", e)
     except KeyboardInterrupt:
         logger.info("Получен сигнал KeyboardInterrupt, завершение.")
     except Exception as e:
-        logger.critical(f"Необработанная ошибка верхнего уровня: {e}", exc_info=True)
+        logger.critical("Необработанная ошибка верхнего уровня: %s", e, exc_info=True)
@@ -1,9 +1,12 @@
 # app/server/consumer/message_validation.py
 # Модуль для валидации данных взятых из очереди logs в RabbitMQ
 
+import logging
 from datetime import datetime
-from pydantic import BaseModel, Field, ValidationError
-from typing import Literal
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from typing import Literal, Mapping
+
+logger = logging.getLogger(__name__)
 
 
 # Класс для валидации данных
@@ -15,7 +18,9 @@ class MessageValidate(BaseModel):
     """
     project: str = Field(max_length=100, pattern=r'^[\w\s\-]+$')
     timestamp: datetime = Field(description="Timestamp в формате ISO 8601")
-    level: Literal["info", "warning", "error", "fatal", "debug", "alert", "unknown"] = Field(max_length=10)  # Ограниченное множество возможных уровней
+    # Ограниченное множество возможных уровней: Literal проверяется в pydantic-core поиском по хэш-таблице,
+    # дополнительное ограничение длины не нужно (оно добавляло бы Python-валидатор на каждое сообщение)
+    level: Literal["info", "warning", "error", "fatal", "debug", "alert", "unknown"]
     module: str = Field(max_length=100)
     function: str = Field(max_length=100)
     message: str = Field(max_length=1000)
@@ -36,22 +41,61 @@ class MessageValidate(BaseModel):
         }
 
 
+# Предкомпилированный валидатор сообщений (схема строится один раз при импорте модуля)
+_MESSAGE_ADAPTER = TypeAdapter(MessageValidate)
+
+
+# Функция для разбора и валидации сообщения напрямую из JSON
+def decode_message(raw: bytes) -> MessageValidate | None:
+    """ Функция для разбора и валидации сообщения из очереди logs за один проход (без промежуточного словаря)
+
+    Arguments:
+        raw {bytes} -- Тело сообщения (JSON)
+
+    Returns:
+        MessageValidate | None -- Провалидированное сообщение или None
+    """
+    
+    try:
+        return _MESSAGE_ADAPTER.validate_json(raw)
+    except ValidationError as e:
+        logger.warning("Validation Error: %s", e)
+        return None
+
+
+
+def as_message(data: MessageValidate | Mapping) -> MessageValidate | None:
+    """ Функция для приведения данных лога к модели MessageValidate
+
+    Уже провалидированная модель возвращается как есть (без повторной валидации и model_dump),
+    словарь валидируется в модель.
+
+    Arguments:
+        data {MessageValidate | Mapping} -- Модель сообщения или словарь с данными лога
+
+    Returns:
+        MessageValidate | None -- Провалидированное сообщение или None
+    """
+    
+    if isinstance(data, MessageValidate):
+        return data
+    return validate_message(data)
+
 # Функция для валидации данных
-async def validate_message(data: dict) -> dict | None:
+def validate_message(data: dict) -> MessageValidate | None:
     """ Функция для валидации данных взятых из очереди logs в RabbitMQ
 
     Arguments:
         data {dict} -- Данные для валидации
 
     Returns:
-        dict | None -- Данные или None
+        MessageValidate | None -- Провалидированное сообщение (без преобразования обратно в словарь) или None
     """
     
     try:
-        valid_message = MessageValidate(**data)
-        return valid_message.model_dump()
+        return _MESSAGE_ADAPTER.validate_python(data)
     except ValidationError as e:
-        print(f"Validation Error: {e}")
+        logger.warning("Validation Error: %s", e)
         return None
 
 
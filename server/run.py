@@ -20,12 +20,11 @@ logger = logging.getLogger(__name__)
 consumer_task: asyncio.Task | None = None
 shutdown_event = asyncio.Event()
 
-async def run_consumer() -> None:
+async def run_consumer(consumer: RabbitMQConsumer) -> None:
     """
     Запуск модуля RabbitMQ Consumer.
     """
     
-    consumer = RabbitMQConsumer()
     try:
         await consumer.run_forever()
     except (ExceptionRabbitMQ.StartError, ExceptionRabbitMQ.StopError, ExceptionRabbitMQ.ConfigUpdateError, ExceptionRabbitMQ.ModuleError) as e:
@@ -42,11 +41,13 @@ def run_api() -> None:
     """
     try:
         uvicorn.run(
-            fastapi,  # Передаём экземпляр приложения, а не функцию
+            "server.api.api:fastapi",  # Строка импорта: без неё uvicorn не поддерживает reload
+            factory=True,
             host=str(cfg.config.api.host),
             port=cfg.config.api.port,
-            reload=True,
-            
+            reload=cfg.config.api.reload,  # Наблюдение за файлами только по флагу из конфигурации (для разработки)
+            loop="auto",   # uvloop, если установлен (на Windows его нет); иначе стандартный asyncio
+            http="auto"    # httptools, если установлен; иначе h11
         )
     except Exception as e:
         logging.error(f"Ошибка при запуске API: {e}", exc_info=True)
@@ -81,19 +82,25 @@ async def run_modules():
         loop.add_signal_handler(sig, lambda: asyncio.create_task(shutdown_handler()))
 
     # Запускаем Consumer как асинхронную задачу
-    consumer_task = asyncio.create_task(run_consumer())
+    consumer = RabbitMQConsumer()
+    consumer_task = asyncio.create_task(run_consumer(consumer))
     
-    await asyncio.sleep(1)
+    # Ждём запуска Consumer (или завершения его задачи при ошибке) вместо фиксированной паузы
+    started_task = asyncio.create_task(consumer.started.wait())
+    await asyncio.wait((started_task, consumer_task), return_when=asyncio.FIRST_COMPLETED)
+    started_task.cancel()
 
     # Попробуем так:
     if cfg.config.api.enabled:
         logging.info("Запуск API...")
+        # reload во встроенном режиме (Server.serve) не поддерживается, event loop уже запущен
         server_config = uvicorn.Config(
             fastapi,
+            factory=True,
             host=str(cfg.config.api.host),
             port=cfg.config.api.port,
             log_level="info",
-            reload=True
+            http="auto"
         )
         server = uvicorn.Server(server_config)
 
@@ -107,4 +114,11 @@ async def run_modules():
         await consumer_task # Ждём завершения consumer
 
 if __name__ == "__main__":
+    # Event loop на libuv (uvloop), если он установлен; иначе стандартный asyncio
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(run_modules())
\ No newline at end of file
@@ -0,0 +1,60 @@
+# app/server/tests/test_config_manager.py
+# Модуль для тестирования менеджера конфигурации
+
+import json
+import pytest
+
+from server.config.config import Manager
+from server.config.schema import ServerConfig
+
+
+@pytest.fixture
+def manager(tmp_path):
+    # Конфигурация сохраняется во временный файл, а не рядом с модулем
+    manager = Manager(ServerConfig())
+    manager._config_file_path = tmp_path / "config.json"
+    return manager
+
+
+def changed_config(**files) -> dict:
+    data = ServerConfig().model_dump(mode="json")
+    data["files"].update(files)
+    return data
+
+
+# Тест на уведомление подписчиков и запись файла при изменении конфигурации
+@pytest.mark.asyncio
+async def test_update_config_changed(manager):
+    seen = []
+    manager.subscribe(seen.append)
+
+    new_config = await manager.update_config(changed_config(log_format="{message}"))
+
+    assert manager.config is new_config
+    assert seen == [new_config]
+    assert json.loads(manager.serialized()) == new_config.model_dump(mode="json")
+    assert json.loads(manager._config_file_path.read_text(encoding="utf-8"))["files"]["log_format"] == "{message}"
+
+
+# Тест на повторную отправку той же конфигурации: без уведомлений и без перезаписи файла
+@pytest.mark.asyncio
+async def test_update_config_unchanged(manager):
+    seen = []
+    manager.subscribe(seen.append)
+
+    await manager.update_config(changed_config(log_format="{message}"))
+    manager._config_file_path.unlink()
+    await manager.update_config(changed_config(log_format="{message}"))
+
+    assert len(seen) == 1
+    assert not manager._config_file_path.exists()
+
+
+# Тест на отклонение некорректной конфигурации без изменения текущей
+@pytest.mark.asyncio
+async def test_update_config_invalid(manager):
+    current = manager.config
+    with pytest.raises(ValueError):
+        await manager.update_config(changed_config(log_format=5))
+    assert manager.config is current
+    assert not manager._config_file_path.exists()
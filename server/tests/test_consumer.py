@@ -2,16 +2,24 @@
 # Модуль для отправки сообщений в очередь RabbitMQ
 
 import asyncio
-import json
 from datetime import datetime, timezone
 from aio_pika import connect_robust, Message
 
 from server.config.config import ConfigManager as cfg
 from server.config.schema import LibraryConfig
 
+try:
+    # Быстрая сериализация JSON сразу в байты
+    from orjson import dumps as json_dumps
+except ImportError:
+    import json
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 message_body = {"project": "home_logger", "timestamp": "2023-10-15T12:34:56Z", "level": "info", "module": "auth", "function": "login", "message": "User logged in successfully.", "code": 123}
 
-async def generate_url(cfg: LibraryConfig.Rabbit) -> str | None:
+def generate_url(cfg: LibraryConfig.Rabbit) -> str | None:
     if cfg.host and cfg.port and cfg.username and cfg.password:
         return f"amqp://{cfg.username}:{cfg.password}@{cfg.host}:{cfg.port}/"
     else:
@@ -19,19 +27,24 @@ async def generate_url(cfg: LibraryConfig.Rabbit) -> str | None:
 
 
 async def send_messages(cfg: LibraryConfig.Rabbit, interval_seconds: int):
-    connection = await connect_robust(await generate_url(cfg))
+    connection = await connect_robust(generate_url(cfg))
     async with connection:
         channel = await connection.channel()
         queue = await channel.declare_queue(cfg.queue, durable=True, arguments={"x-message-ttl": 30000})
 
+        # Точка обмена, ключ маршрутизации и свойства сообщения не меняются между отправками
+        exchange = channel.default_exchange
+        routing_key = queue.name
+        properties = {"content_type": "application/json"}
+
         while True:
             current_time = str(datetime.now(timezone.utc))
             message_body["timestamp"] = current_time
-            serialized_message = json.dumps(message_body)
-            message = Message(body=serialized_message.encode(), content_type='application/json')
+            serialized_message = json_dumps(message_body)
+            message = Message(body=serialized_message, **properties)
 
-            await channel.default_exchange.publish(message, routing_key=queue.name)
-            print(f"Sent message at {current_time}: {serialized_message}")
+            await exchange.publish(message, routing_key=routing_key)
+            print(f"Sent message at {current_time}: {serialized_message.decode()}")
 
             await asyncio.sleep(interval_seconds)
 
@@ -39,7 +52,9 @@ async def send_messages(cfg: LibraryConfig.Rabbit, interval_seconds: int):
 if __name__ == '__main__':
     try:
         print('start')
-        asyncio.run(send_messages(LibraryConfig.Rabbit(**cfg.config.rabbitmq.model_dump()), 10))
+        # В настройки библиотеки передаём только общие поля (остальные есть только у сервера)
+        rabbitmq = cfg.config.rabbitmq.model_dump(include={"host", "port", "username", "password", "queue"})
+        asyncio.run(send_messages(LibraryConfig.Rabbit(**rabbitmq), 10))
     except Exception as ex:
         print(f"Error - {ex}")
     finally:
@@ -0,0 +1,96 @@
+# app/server/tests/test_consumer_batch.py
+# Модуль для тестирования подтверждения пачек сообщений в получателе RabbitMQ
+
+import asyncio
+import pytest
+
+from server.rabbitmq.consumer import RabbitMQConsumer
+
+
+message_body = b'{"project": "home_logger", "timestamp": "2023-10-15T12:34:56Z", "level": "info", "module": "auth", "function": "login", "message": "User logged in successfully.", "code": 123}'
+
+
+class StubMessage:
+    """ Класс сообщения с записью подтверждений (ack/nack) в общий список событий """
+
+    def __init__(self, events: list, channel: int, tag: int):
+        self.body = message_body
+        self.channel = channel
+        self.tag = tag
+        self._events = events
+
+    async def ack(self, multiple: bool = False):
+        self._events.append(("ack", self.channel, self.tag, multiple))
+
+    async def nack(self, multiple: bool = False, requeue: bool = True):
+        self._events.append(("nack", self.channel, self.tag, multiple, requeue))
+
+
+class StubSink:
+    """ Класс приёмника логов с заданным результатом записи (значение или исключение) """
+
+    def __init__(self, result=True):
+        self.result = result
+        self.batches = []
+
+    async def write_logs(self, logs):
+        self.batches.append(len(logs))
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+    async def print_logs(self, logs):
+        self.batches.append(len(logs))
+
+
+def make_flush(database=True, files=True):
+    consumer = RabbitMQConsumer()
+    consumer._database_client = StubSink(database)
+    consumer._console_client = StubSink(None)
+    consumer._files_client = StubSink(files)
+    return consumer._make_handler()
+
+
+async def run_batch(flush):
+    # Пачка из двух каналов: некорректное сообщение тоже подтверждается вместе с пачкой
+    events = []
+    messages = [StubMessage(events, 0, 1), StubMessage(events, 1, 1), StubMessage(events, 0, 2)]
+    await flush([(None, messages[0]), (object(), messages[1]), (object(), messages[2])])
+    return sorted(events)
+
+
+# Тест на одно подтверждение с multiple=True на канал для последнего сообщения пачки
+@pytest.mark.asyncio
+async def test_flush_acks_last_message_per_channel():
+    _, flush = make_flush()
+    assert await run_batch(flush) == [("ack", 0, 2, True), ("ack", 1, 1, True)]
+
+
+# Тест на возврат пачки в очередь при сбое любого приёмника (False или исключение)
+@pytest.mark.asyncio
+@pytest.mark.parametrize("database, files", [(False, True), (True, False), (RuntimeError("db down"), True), (True, OSError("disk full"))])
+async def test_flush_requeues_on_sink_failure(database, files):
+    _, flush = make_flush(database, files)
+    assert await run_batch(flush) == [("nack", 0, 2, True, True), ("nack", 1, 1, True, True)]
+
+
+# Тест на то, что все сообщения пачки доходят до приёмников через обработчик
+@pytest.mark.asyncio
+async def test_handler_enqueues_messages():
+    consumer = RabbitMQConsumer()
+    consumer._database_client = sink = StubSink()
+    consumer._console_client = consumer._files_client = None
+    handler, flush = consumer._make_handler()
+    consumer._handle, consumer._flush = handler, flush
+    consumer._batcher_task = asyncio.create_task(consumer._batch_loop())
+
+    events = []
+    for tag in range(3):
+        message = StubMessage(events, 0, tag)
+        if tag == 1:
+            message.body = b"not json"
+        await handler(message)
+    await consumer._stop_batcher()
+
+    assert sink.batches == [2]
+    assert events == [("ack", 0, 2, True)]
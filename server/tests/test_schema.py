@@ -0,0 +1,49 @@
+# app/server/tests/test_schema.py
+# Модуль для тестирования схемы конфигурации сервера
+
+import copy
+import json
+import pytest
+from pydantic import ValidationError
+
+from server.config.schema import ServerConfig, validate_server
+
+
+# Полная конфигурация с длинным шаблоном (длиннее 64 символов: строки не берутся из кэша pydantic-core)
+CONFIG = ServerConfig().model_dump(mode="json")
+CONFIG["files"]["log_format"] = "[{project}] [{timestamp}] [{level}] {module}.{function}: {message} [{code}] (long template)"
+
+
+# Тест на равенство разделов files, собранных из одинаковых данных
+def test_files_equal_for_same_data():
+    data = json.loads(json.dumps(CONFIG))
+    assert validate_server(data).files == validate_server(copy.deepcopy(data)).files
+
+    # Те же данные, разобранные из JSON дважды (разные объекты строк с одинаковым содержимым)
+    raw = json.dumps(CONFIG)
+    assert validate_server(json.loads(raw)).files == validate_server(json.loads(raw)).files
+
+
+# Тест на форматирование лог-записи по шаблону files.log_format
+def test_files_format_log():
+    files = ServerConfig.Files(log_format="[{level}] {message} {code:06d}")
+    assert files.format_log(level="info", message="hi", code=42) == "[info] hi 000042"
+
+
+# Тест на разбор шаблона вывода в консоль на текст и имена полей
+def test_console_format_parts():
+    console = ServerConfig.Console(format="[{project}] {message}!")
+    assert console.format_parts == (("[", "project"), ("] ", "message"), ("!", None))
+
+
+# Тест на допустимые адреса хоста: localhost, IPv4 и IPv6
+@pytest.mark.parametrize("host", ["localhost", "127.0.0.1", "10.0.0.5", "::1"])
+def test_host_accepts(host):
+    assert ServerConfig.RabbitMq(host=host).host == host
+
+
+# Тест на недопустимые адреса хоста
+@pytest.mark.parametrize("host", ["", "example.com", "256.0.0.1", "127.0.0"])
+def test_host_rejects(host):
+    with pytest.raises(ValidationError):
+        ServerConfig.RabbitMq(host=host)
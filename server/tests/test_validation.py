@@ -0,0 +1,35 @@
+# app/server/tests/test_validation.py
+# Модуль для тестирования валидации сообщений из очереди logs
+
+from datetime import datetime, timezone
+
+from server.rabbitmq.validation import MessageValidate, as_message, decode_message
+
+
+message_body = b'{"project": "home_logger", "timestamp": "2023-10-15T12:34:56Z", "level": "info", "module": "auth", "function": "login", "message": "User logged in successfully.", "code": 123}'
+
+
+# Тест на разбор корректного сообщения в типизированную модель
+def test_decode_message():
+    log = decode_message(message_body)
+    assert isinstance(log, MessageValidate)
+    assert log.project == "home_logger"
+    assert log.timestamp == datetime(2023, 10, 15, 12, 34, 56, tzinfo=timezone.utc)
+    assert log.level == "info"
+    assert log.code == 123
+
+
+# Тест на некорректные сообщения: не JSON, неизвестный уровень, лишний код, пропущенное поле
+def test_decode_message_invalid():
+    assert decode_message(b"not json") is None
+    assert decode_message(message_body.replace(b'"info"', b'"verbose"')) is None
+    assert decode_message(message_body.replace(b"123", b"1000000")) is None
+    assert decode_message(b'{"project": "home_logger"}') is None
+
+
+# Тест на приведение словаря и готовой модели к MessageValidate
+def test_as_message():
+    log = decode_message(message_body)
+    assert as_message(log) is log
+    assert as_message(log.model_dump()) == log
+    assert as_message({"project": "home_logger"}) is None